@@ -6,6 +6,8 @@ import io
 import json
 import logging
 import re
+import uuid
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
@@ -14,7 +16,7 @@ from PIL import Image
 from openai import AsyncOpenAI
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from browser import SimpleBrowser, BrowserType
+from browser import BrowserPool, SimpleBrowser, BrowserType
 from exceptions import ActionParseError, LLMError, LLMResponseError
 from message_types import ImageObj, SystemMessage, UserMessage, message_to_openai_format
 from prompts import get_computer_use_system_prompt
@@ -31,6 +33,8 @@ class FaraAgent:
         "patch_size": 14,
         "merge_size": 2,
     }
+    # Number of recent actions echoed back to the model in the per-round context.
+    RECENT_ACTIONS_IN_CONTEXT = 2
 
     def __init__(
         self,
@@ -38,8 +42,10 @@ class FaraAgent:
         headless: bool = True,
         browser_type: BrowserType = "firefox",
         logger: Optional[logging.Logger] = None,
+        browser_pool: Optional[BrowserPool] = None,
     ):
         self.config = config
+        self.browser_pool = browser_pool
         self.headless = headless
         self.browser_type = browser_type
         self.logger = logger or logging.getLogger("fara_agent")
@@ -96,15 +102,23 @@ class FaraAgent:
         self._page_changed_since_last_action: bool = False
         self._verified_expectations: list[tuple[str, str]] = []
         self._transitions: list[dict[str, Any]] = []
+        # Post-click element description, reused for the round's trace entry.
+        self._last_element_info: Optional[dict[str, Any]] = None
 
     async def start(self) -> None:
         """Initialize the agent."""
-        await self.browser.start()
+        if self.browser_pool:
+            await self.browser_pool.acquire(self.browser)
+        else:
+            await self.browser.start()
         self.logger.info(f"Agent started with {self.browser_type} browser")
 
     async def close(self) -> None:
         """Close the agent."""
-        await self.browser.close()
+        if self.browser_pool:
+            await self.browser_pool.release(self.browser)
+        else:
+            await self.browser.close()
         self.logger.info("Agent closed")
 
     async def _get_screenshot(self) -> Image.Image:
@@ -278,6 +292,7 @@ class FaraAgent:
             action = "left_click"
         if action == "input_text":
             action = "type"
+        self._last_element_info = None
 
         try:
             if action == "visit_url":
@@ -301,6 +316,7 @@ class FaraAgent:
                 
                 # Get element info before click
                 element_info = await self.browser.click(scaled[0], scaled[1])
+                self._last_element_info = element_info
                 try:
                     clicked_text = (
                         str(element_info.get("text")).strip()
@@ -323,25 +339,27 @@ class FaraAgent:
 
                 info_str = self._format_element_info(element_info)
                 if self.show_click_markers:
-                    await self.browser.show_click_marker(scaled[0], scaled[1], "click")
+                    self.browser.set_pending_click_marker(scaled[0], scaled[1], "click")
                 return f"I clicked at coordinates ({scaled[0]:.1f}, {scaled[1]:.1f}).{info_str}"
 
             elif action == "double_click":
                 coord = action_args.get("coordinate", [0, 0])
                 scaled = self._convert_resized_coords_to_viewport(coord)
                 element_info = await self.browser.double_click(scaled[0], scaled[1])
+                self._last_element_info = element_info
                 info_str = self._format_element_info(element_info)
                 if self.show_click_markers:
-                    await self.browser.show_click_marker(scaled[0], scaled[1], "dblclick")
+                    self.browser.set_pending_click_marker(scaled[0], scaled[1], "dblclick")
                 return f"I double-clicked at ({scaled[0]:.1f}, {scaled[1]:.1f}).{info_str}"
 
             elif action == "right_click":
                 coord = action_args.get("coordinate", [0, 0])
                 scaled = self._convert_resized_coords_to_viewport(coord)
                 element_info = await self.browser.right_click(scaled[0], scaled[1])
+                self._last_element_info = element_info
                 info_str = self._format_element_info(element_info)
                 if self.show_click_markers:
-                    await self.browser.show_click_marker(scaled[0], scaled[1], "right")
+                    self.browser.set_pending_click_marker(scaled[0], scaled[1], "right")
                 return f"I right-clicked at ({scaled[0]:.1f}, {scaled[1]:.1f}).{info_str}"
 
             elif action in ("mouse_move", "hover"):
@@ -349,7 +367,7 @@ class FaraAgent:
                 scaled = self._convert_resized_coords_to_viewport(coord)
                 await self.browser.hover(scaled[0], scaled[1])
                 if self.show_click_markers:
-                    await self.browser.show_click_marker(scaled[0], scaled[1], "hover")
+                    self.browser.set_pending_click_marker(scaled[0], scaled[1], "hover")
                 return f"I moved the cursor to ({scaled[0]:.1f}, {scaled[1]:.1f})."
 
             elif action == "drag_and_drop":
@@ -371,9 +389,9 @@ class FaraAgent:
                 if coord:
                     scaled = self._convert_resized_coords_to_viewport(coord)
                     self._record_action_coord(action, scaled)
-                    await self.browser.click(scaled[0], scaled[1])
+                    await self.browser.click(scaled[0], scaled[1], describe_after=False)
                     if self.show_click_markers:
-                        await self.browser.show_click_marker(scaled[0], scaled[1], "type")
+                        self.browser.set_pending_click_marker(scaled[0], scaled[1], "type")
 
                 await self.browser.type_text(text, press_enter, delete_existing_text)
                 if press_enter:
@@ -516,7 +534,10 @@ class FaraAgent:
         return get_trimmed_url(url or "", 300).lower()
 
     def _build_context_text(
-        self, test_case: TestCase, action_history: list[str], rounds_left: int
+        self,
+        test_case: TestCase,
+        action_history: deque[tuple[int, str, str]],
+        rounds_left: int,
     ) -> str:
         """Assemble minimal context for the model (keep it a policy, not a planner)."""
         current_url = self.browser.get_url()
@@ -556,7 +577,7 @@ class FaraAgent:
         if action_history:
             lines.append("")
             lines.append("Recent actions:")
-            lines.extend(action_history[-2:])
+            lines.extend(f"{idx}. {name}: {result}" for idx, name, result in action_history)
 
         repeat_warnings = self._get_repeat_warnings()
         if repeat_warnings:
@@ -1038,11 +1059,15 @@ class FaraAgent:
             + "\n\nYou are executing an end-to-end test case. Be decisive and avoid loops."
         )
         task_brief_msg = SystemMessage(content=self._build_task_brief(test_case))
-        action_history: list[str] = []
+        action_history: deque[tuple[int, str, str]] = deque(maxlen=self.RECENT_ACTIONS_IN_CONTEXT)
 
         for round_num in range(self.max_rounds):
             self.round_count = round_num + 1
             self.logger.info(f"Round {self.round_count}/{self.max_rounds}")
+            # One screenshot path per round, shared by every trace recorded in it.
+            round_screenshot_path = (
+                screenshot_dir / f"step-{self.round_count:02d}.png" if self.save_screenshots else None
+            )
 
             # page_changed refers to a navigation that happened since the previous model action.
             self._page_changed = bool(self._page_changed_since_last_action)
@@ -1061,11 +1086,9 @@ class FaraAgent:
                 # This check is intentionally auto-FAIL only.
                 success = False
                 fail_reason = text_reason or "Auto fail: expected text missing after navigation."
-                screenshot_path = None
-                if self.save_screenshots:
-                    screenshot_path = screenshot_dir / f"step-{round_num + 1:02d}.png"
-                    if not screenshot_path.exists():
-                        screenshot.save(screenshot_path)
+                screenshot_path = round_screenshot_path
+                if screenshot_path is not None and not screenshot_path.exists():
+                    screenshot.save(screenshot_path)
                 actions.append(
                     ActionTrace(
                         round_index=round_num + 1,
@@ -1098,11 +1121,9 @@ class FaraAgent:
             if auto_pass:
                 success = True
                 fail_reason = auto_pass_reason or "Pass criteria satisfied."
-                screenshot_path = None
-                if self.save_screenshots:
-                    screenshot_path = screenshot_dir / f"step-{round_num + 1:02d}.png"
-                    if not screenshot_path.exists():
-                        screenshot.save(screenshot_path)
+                screenshot_path = round_screenshot_path
+                if screenshot_path is not None and not screenshot_path.exists():
+                    screenshot.save(screenshot_path)
                 actions.append(
                     ActionTrace(
                         round_index=round_num + 1,
@@ -1224,6 +1245,7 @@ class FaraAgent:
             before_url_norm = self._normalize_for_compare(self.browser.get_url())
             result = await self._execute_action(action_args)
             action_duration = (datetime.utcnow() - action_start).total_seconds() * 1000
+            await self.browser.flush_click_marker()
             self.logger.info(f"Action result: {result}")
 
             # Repeat-action streak detector (helps break nav/scroll loops early).
@@ -1329,20 +1351,19 @@ class FaraAgent:
                 pass
 
             # Capture console errors
-            console_msgs = self.browser.get_console_messages()
+            console_msgs = self.browser.console_messages
             console_errors = [m["text"] for m in console_msgs if m.get("type") == "error"]
             if console_errors:
                 self._console_errors.extend(console_errors[-5:])
 
-            screenshot_path = None
-            if self.save_screenshots:
-                screenshot_path = screenshot_dir / f"step-{round_num + 1:02d}.png"
+            screenshot_path = round_screenshot_path
+            if screenshot_path is not None:
                 screenshot.save(screenshot_path)
 
-            # Get element info for trace
+            # Get element info for trace (clicks already described their target)
             coord = action_args.get("coordinate")
-            element_info = None
-            if coord:
+            element_info = self._last_element_info
+            if element_info is None and coord:
                 scaled = self._convert_resized_coords_to_viewport(coord)
                 element_info = await self.browser.get_element_at(scaled[0], scaled[1])
 
@@ -1370,8 +1391,8 @@ class FaraAgent:
                 success=None,
             )
 
-            action_summary = f"{round_num + 1}. {action_args.get('action')}: {result}"
-            action_history.append(action_summary)
+            # Formatted lazily in _build_context_text; only the last few entries are kept.
+            action_history.append((round_num + 1, action_args.get("action"), result))
 
             # Auto-verdict if obviously done
             auto_status, auto_reason = self._check_auto_verdict(
@@ -1463,6 +1484,7 @@ class FaraAgent:
             actions=actions,
             facts=self.facts.copy(),
             browser_type=self.browser_type,
+            run_id=run_id,
             final_url=self.browser.get_url(),
             console_errors=self._console_errors.copy(),
         )
@@ -1477,6 +1499,6 @@ class FaraAgent:
         )
         await self.run_test_case(
             test_case=test_case,
-            run_id=f"adhoc-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}",
+            run_id=f"adhoc-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}",
             screenshots_root=Path(self.screenshots_folder),
         )
@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 import asyncio
+import base64
 import logging
 import os
+from collections import deque
 from pathlib import Path
-from typing import Any, Literal, Optional
+from typing import Any, Awaitable, Final, Literal, Optional
 
 from playwright.async_api import (
     Browser,
     BrowserContext,
+    CDPSession,
+    ElementHandle,
     Page,
     Playwright,
     async_playwright,
@@ -26,11 +30,337 @@ from exceptions import (
 )
 
 BrowserType = Literal["chromium", "firefox", "webkit"]
+_LAUNCHERS = frozenset({"chromium", "firefox", "webkit"})
+
+
+def _check_browser_type(browser_type: str) -> None:
+    """Fail fast on an unknown engine instead of after starting Playwright."""
+    if browser_type not in _LAUNCHERS:
+        raise BrowserError(
+            f"Unsupported browser type: {browser_type}",
+            {"browser_type": browser_type, "supported": sorted(_LAUNCHERS)},
+        )
+
+
+def _is_navigation_error(exc: Exception) -> bool:
+    """True for evaluate failures caused by the page navigating away mid-call."""
+    message = str(exc)
+    return "Execution context was destroyed" in message or "navigated" in message.lower()
+
+
+def _compact_js(source: str) -> str:
+    """Drop indentation and blank lines from JS sent on every evaluate call (newlines are kept)."""
+    return "\n".join(line.strip() for line in source.splitlines() if line.strip())
+
+
+# Init scripts run before the document has a <body>, so mount once it exists.
+_OVERLAY_JS: Final[str] = """(() => {
+    const mount = () => {
+        if (document.getElementById('fara-debug-overlay')) return;
+        const el = document.createElement('div');
+        el.id = 'fara-debug-overlay';
+        el.style.cssText = `
+            position: fixed; bottom: 8px; right: 8px; max-width: 42vw;
+            padding: 10px 12px; border-radius: 10px;
+            font: 12px/1.45 "Fira Code", Menlo, Consolas, monospace;
+            color: #e9f5ff;
+            background: linear-gradient(145deg, rgba(12,17,28,0.92), rgba(20,32,52,0.9));
+            border: 1px solid rgba(255,255,255,0.14);
+            z-index: 2147483647; pointer-events: none;
+            box-shadow: 0 8px 20px rgba(0,0,0,0.45);
+            white-space: pre-wrap; backdrop-filter: blur(6px);
+            max-height: 42vh; overflow: hidden;
+            display: flex; flex-direction: column; gap: 4px; text-align: left;
+        `;
+        el.textContent = 'Fara debug overlay ready.';
+        document.body.appendChild(el);
+    };
+    if (document.body) mount();
+    else document.addEventListener('DOMContentLoaded', mount, { once: true });
+})();"""
+
+_CLICK_MARKER_JS: Final[str] = """(() => {
+    const mount = () => {
+        const el = document.createElement('div');
+        el.id = 'fara-click-marker';
+        el.style.cssText = `
+            position: fixed; width: 30px; height: 30px; border-radius: 50%;
+            border: 2px solid #5bd1ff;
+            box-shadow: 0 0 12px rgba(91,209,255,0.65);
+            background: rgba(91,209,255,0.15);
+            z-index: 2147483647; pointer-events: none;
+            transform: translate(-50%, -50%); display: none;
+        `;
+        const label = document.createElement('div');
+        label.id = 'fara-click-marker-label';
+        label.style.cssText = `
+            position: absolute; bottom: -14px; left: 50%;
+            transform: translateX(-50%);
+            font: 11px/1.2 "Fira Code", Menlo, Consolas, monospace;
+            padding: 2px 6px; border-radius: 6px;
+            background: rgba(0,0,0,0.7); color: #e9f5ff;
+            white-space: nowrap; box-shadow: 0 2px 6px rgba(0,0,0,0.35);
+        `;
+        label.textContent = 'click';
+        el.appendChild(label);
+        document.body.appendChild(el);
+        return el;
+    };
+    let el = null;
+    let labelEl = null;
+    let hideTimer = null;
+    const hide = () => { el.style.display = 'none'; };
+    // Mounts the marker on first use and keeps the element references, so later
+    // calls do no DOM lookups.
+    window.__faraShowClickMarker = (vx, vy, lbl) => {
+        if (!document.body) return;
+        if (!el || !el.isConnected) {
+            el = mount();
+            labelEl = el.firstChild;
+        }
+        labelEl.textContent = lbl || 'click';
+        el.style.left = `${vx}px`;
+        el.style.top = `${vy}px`;
+        el.style.display = 'block';
+        clearTimeout(hideTimer);
+        hideTimer = setTimeout(hide, 1000);
+    };
+})();"""
+
+_TOGGLE_JS: Final[str] = _compact_js("""([id, visible, displayType]) => {
+    const el = document.getElementById(id);
+    if (!el) return false;
+    const wasVisible = el.style.display !== 'none';
+    el.style.display = visible ? displayType : 'none';
+    return wasVisible;
+}""")
+
+_GET_ELEMENT_AT_JS: Final[str] = _compact_js("""([vx, vy]) => {
+    const el = document.elementFromPoint(vx, vy);
+    if (!el) return { found: false };
+
+    const rect = el.getBoundingClientRect();
+    const style = window.getComputedStyle(el);
+    const isVisible = style.display !== 'none'
+        && style.visibility !== 'hidden'
+        && style.opacity !== '0'
+        && rect.width > 0
+        && rect.height > 0;
+
+    const isDisabled = el.disabled === true
+        || el.getAttribute('aria-disabled') === 'true';
+
+    const isInteractable = isVisible && !isDisabled
+        && style.pointerEvents !== 'none';
+
+    return {
+        found: true,
+        tag: (el.tagName || '').toLowerCase(),
+        type: (el.type || '').toLowerCase(),
+        id: el.id || '',
+        className: el.className || '',
+        role: el.getAttribute('role') || '',
+        ariaLabel: el.getAttribute('aria-label') || '',
+        ariaChecked: el.getAttribute('aria-checked'),
+        checked: 'checked' in el ? !!el.checked : null,
+        disabled: isDisabled,
+        text: (el.innerText || '').trim().slice(0, 200),
+        placeholder: el.placeholder || '',
+        value: el.value || '',
+        href: el.href || '',
+        isVisible,
+        isInteractable,
+        rect: { x: rect.x, y: rect.y, width: rect.width, height: rect.height },
+        selector: _buildSelector(el),
+    };
+
+    function _buildSelector(elem) {
+        if (elem.id) return '#' + elem.id;
+        let path = [];
+        // Stop at the first id or data-testid anchor; six segments resolve in practice.
+        while (elem && elem.nodeType === Node.ELEMENT_NODE && path.length < 6) {
+            if (elem.id) {
+                path.unshift('#' + elem.id);
+                break;
+            }
+            const testId = elem.getAttribute('data-testid');
+            if (testId) {
+                path.unshift('[data-testid="' + testId.replace(/"/g, '\\\\"') + '"]');
+                break;
+            }
+            let selector = elem.tagName.toLowerCase();
+            const parent = elem.parentElement;
+            if (parent && parent.children.length > 1) {
+                let nth = 0;
+                for (const sib of parent.children) {
+                    if (sib.tagName === elem.tagName) nth++;
+                    if (sib === elem) break;
+                }
+                if (nth > 1) selector += ':nth-of-type(' + nth + ')';
+            }
+            path.unshift(selector);
+            elem = parent;
+        }
+        return path.join(' > ');
+    }
+}""")
+
+_ELEMENT_FROM_POINT_JS: Final[str] = "([vx, vy]) => document.elementFromPoint(vx, vy)"
+
+_SCROLL_POSITION_JS: Final[str] = """() => {
+    const y = window.scrollY || 0;
+    const x = window.scrollX || 0;
+    const h = Math.max(
+        document.body.scrollHeight || 0,
+        document.documentElement.scrollHeight || 0
+    );
+    const w = Math.max(
+        document.body.scrollWidth || 0,
+        document.documentElement.scrollWidth || 0
+    );
+    const vh = window.innerHeight || 1;
+    const vw = window.innerWidth || 1;
+    return { x, y, scrollHeight: h, scrollWidth: w, viewportH: vh, viewportW: vw };
+}"""
+
+# Counts DOM mutations for wait_for_condition; installed on demand, once per document.
+_DOM_REVISION_JS: Final[str] = """(() => {
+    if (typeof window.__faraDomRev === 'number') return;
+    window.__faraDomRev = 0;
+    const observe = () => new MutationObserver(() => { window.__faraDomRev++; }).observe(
+        document.documentElement,
+        { childList: true, subtree: true, attributes: true, characterData: true },
+    );
+    if (document.documentElement) observe();
+    else document.addEventListener('DOMContentLoaded', observe, { once: true });
+})();"""
+
+_DOM_REVISION_READ_JS: Final[str] = "() => (typeof window.__faraDomRev === 'number' ? window.__faraDomRev : null)"
+
+# Scroll to the top (false) or bottom (true) and measure, in one round-trip.
+_SCROLL_TO_JS: Final[str] = _compact_js(f"""(toBottom) => {{
+    window.scrollTo(0, toBottom ? Math.max(
+        document.body.scrollHeight || 0,
+        document.documentElement.scrollHeight || 0
+    ) : 0);
+    return ({_SCROLL_POSITION_JS})();
+}}""")
+
+_BODY_TEXT_JS: Final[str] = _compact_js("""() => {
+    const t = document.body?.innerText || "";
+    return t.slice(0, 1200);
+}""")
+
+_WAIT_FOR_SELECTOR_JS: Final[str] = _compact_js("""([sel, state, timeout]) => {
+    try {
+        document.querySelector(sel);
+    } catch (e) {
+        return null;  // not plain CSS; let Playwright handle it
+    }
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        const style = window.getComputedStyle(el);
+        return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden';
+    };
+    const check = () => {
+        const el = document.querySelector(sel);
+        switch (state) {
+            case 'attached': return !!el;
+            case 'detached': return !el;
+            case 'hidden': return !el || !isVisible(el);
+            default: return !!el && isVisible(el);
+        }
+    };
+    if (check()) return true;
+    return new Promise((resolve) => {
+        let observer = null, interval = null, timer = null;
+        const finish = (value) => {
+            if (observer) observer.disconnect();
+            clearInterval(interval);
+            clearTimeout(timer);
+            resolve(value);
+        };
+        const onChange = () => { if (check()) finish(true); };
+        observer = new MutationObserver(onChange);
+        observer.observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true,
+        });
+        interval = setInterval(onChange, Math.max(1, Math.min(100, timeout / 5)));
+        timer = setTimeout(() => finish(false), timeout);
+    });
+}""")
+
+_SET_OVERLAY_TEXT_JS: Final[str] = _compact_js("""(msg) => {
+    let el = document.getElementById('fara-debug-overlay');
+    if (el) el.textContent = msg;
+}""")
+
+_SHOW_CLICK_MARKER_JS: Final[str] = (
+    "([vx, vy, lbl]) => window.__faraShowClickMarker && window.__faraShowClickMarker(vx, vy, lbl)"
+)
+
+_INPUT_KIND_JS: Final[str] = "el => [(el.tagName || '').toLowerCase(), (el.type || '').toLowerCase()]"
+
+# Named keys press_keys can send as raw CDP key events: key -> (keyCode, code, text).
+# Matches Playwright's US layout; chords and other keys go through keyboard.press.
+_CDP_KEYS: Final[dict[str, tuple[int, str, str]]] = {
+    "Enter": (13, "Enter", "\r"),
+    "Tab": (9, "Tab", ""),
+    "Backspace": (8, "Backspace", ""),
+    "Escape": (27, "Escape", ""),
+    "Delete": (46, "Delete", ""),
+    "Home": (36, "Home", ""),
+    "End": (35, "End", ""),
+    "PageUp": (33, "PageUp", ""),
+    "PageDown": (34, "PageDown", ""),
+    "ArrowUp": (38, "ArrowUp", ""),
+    "ArrowDown": (40, "ArrowDown", ""),
+    "ArrowLeft": (37, "ArrowLeft", ""),
+    "ArrowRight": (39, "ArrowRight", ""),
+}
+
+
+def _cdp_key_events(key: str) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Input.dispatchKeyEvent payloads (down, up) for a key in _CDP_KEYS."""
+    key_code, code, text = _CDP_KEYS[key]
+    base = {"key": key, "code": code, "windowsVirtualKeyCode": key_code}
+    down = {**base, "type": "keyDown", "text": text} if text else {**base, "type": "rawKeyDown"}
+    return down, {**base, "type": "keyUp"}
 
 
 class SimpleBrowser:
     """Browser manager using Playwright with multi-browser support and intelligent waiting."""
 
+    __slots__ = (
+        "browser_type",
+        "headless",
+        "viewport_width",
+        "viewport_height",
+        "logger",
+        "downloads_folder",
+        "show_overlay",
+        "show_click_markers",
+        "slow_mo",
+        "_overlay_created",
+        "_marker_created",
+        "_pending_marker",
+        "_last_overlay_text",
+        "_playwright",
+        "browser",
+        "context",
+        "page",
+        "_owns_browser",
+        "_pool_slot",
+        "_cdp",
+        "_cdp_page",
+        "_current_frame",
+        "last_download_path",
+        "_console_messages",
+        "_console_version",
+        "_console_snapshot",
+        "_console_snapshot_version",
+    )
+
     def __init__(
         self,
         browser_type: BrowserType = "firefox",
@@ -43,6 +373,7 @@ class SimpleBrowser:
         slow_mo: int = 0,
         logger: Optional[logging.Logger] = None,
     ):
+        _check_browser_type(browser_type)
         self.browser_type = browser_type
         self.headless = headless
         self.viewport_width = viewport_width
@@ -54,14 +385,27 @@ class SimpleBrowser:
         self.slow_mo = slow_mo
         self._overlay_created = False
         self._marker_created = False
+        # Marker for the current action, drawn by flush_click_marker(); one per page.
+        self._pending_marker: Optional[tuple[float, float, str]] = None
         self._last_overlay_text: str | None = None
 
         self._playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        # False when the Playwright/Browser pair is lent by a BrowserPool.
+        self._owns_browser = True
+        # True while this browser holds a BrowserPool slot; release() only acts then.
+        self._pool_slot = False
+        # Chromium-only CDP session for fast screenshots, tied to the page it was opened on.
+        self._cdp: Optional[CDPSession] = None
+        self._cdp_page: Optional[Page] = None
+        self._current_frame: Any = None
         self.last_download_path: str | None = None
-        self._console_messages: list[dict[str, Any]] = []
+        self._console_messages: deque[dict[str, Any]] = deque(maxlen=100)
+        self._console_version = 0
+        self._console_snapshot: tuple[dict[str, Any], ...] = ()
+        self._console_snapshot_version = 0
 
     def _ensure_started(self) -> None:
         """Raise if browser not started."""
@@ -69,37 +413,42 @@ class SimpleBrowser:
             raise BrowserNotStartedError()
 
     async def start(self) -> None:
-        """Start the browser with specified engine."""
-        self._playwright = await async_playwright().start()
-
-        # Select browser engine
-        browser_launcher = getattr(self._playwright, self.browser_type)
-        launch_options: dict[str, Any] = {"headless": self.headless}
-        if self.slow_mo > 0:
-            launch_options["slow_mo"] = self.slow_mo
-
-        self.browser = await browser_launcher.launch(**launch_options)
+        """Start the browser with specified engine (or open a context on a pooled browser)."""
+        if self.browser is None:
+            self._playwright = await async_playwright().start()
+
+            # Select browser engine
+            browser_launcher = getattr(self._playwright, self.browser_type)
+            launch_options: dict[str, Any] = {"headless": self.headless}
+            if self.slow_mo > 0:
+                launch_options["slow_mo"] = self.slow_mo
+
+            self.browser = await browser_launcher.launch(**launch_options)
+            self._owns_browser = True
         self.context = await self.browser.new_context(
             viewport={"width": self.viewport_width, "height": self.viewport_height}
         )
+        if self.downloads_folder:
+            os.makedirs(self.downloads_folder, exist_ok=True)
+
         self.page = await self.context.new_page()
+        await self._setup_page()
 
+        if self.show_click_markers:
+            await self._setup_click_marker_init_script()
+
+        self.logger.info(f"Browser started: {self.browser_type} (headless={self.headless})")
+
+    async def _setup_page(self) -> None:
+        """Attach event handlers and per-page init scripts to the current page."""
         # Capture console messages
         self.page.on("console", self._handle_console)
 
         if self.downloads_folder:
-            os.makedirs(self.downloads_folder, exist_ok=True)
             self.page.on("download", self._handle_download)
 
         if self.show_overlay:
             await self._setup_overlay_init_script()
-            await self._inject_overlay()
-
-        if self.show_click_markers:
-            await self._setup_click_marker_init_script()
-            await self._inject_click_marker()
-
-        self.logger.info(f"Browser started: {self.browser_type} (headless={self.headless})")
 
     async def set_viewport_size(self, width: int, height: int) -> None:
         """Resize the viewport to match the model's coordinate space (best-effort)."""
@@ -109,11 +458,6 @@ class SimpleBrowser:
         await self.page.set_viewport_size({"width": int(width), "height": int(height)})
         self.viewport_width = int(width)
         self.viewport_height = int(height)
-        # Re-inject helpers if needed (Playwright keeps them, but this is safe).
-        if self.show_overlay:
-            await self._inject_overlay()
-        if self.show_click_markers:
-            await self._inject_click_marker()
 
     def _handle_console(self, msg: Any) -> None:
         """Capture console messages."""
@@ -121,10 +465,8 @@ class SimpleBrowser:
             "type": msg.type,
             "text": msg.text,
             "location": msg.location,
-        })
-        # Keep only last 100 messages
-        if len(self._console_messages) > 100:
-            self._console_messages = self._console_messages[-100:]
+        })  # deque keeps only the last 100 messages
+        self._console_version += 1
 
     async def _handle_download(self, download: Any) -> None:
         """Handle file downloads."""
@@ -143,6 +485,14 @@ class SimpleBrowser:
             await self.page.close()
         if self.context:
             await self.context.close()
+        if not self._owns_browser:
+            # Pooled browser: only the context was ours.
+            self._cdp = None
+            self._cdp_page = None
+            self.page = None
+            self.context = None
+            self.logger.info("Browser context closed")
+            return
         if self.browser:
             await self.browser.close()
         if self._playwright:
@@ -170,14 +520,14 @@ class SimpleBrowser:
         except Exception as e:
             raise NavigationError(f"Navigation failed: {e}", url=url) from e
 
-    async def wait_for_load_state(
+    def wait_for_load_state(
         self,
         state: Literal["load", "domcontentloaded", "networkidle"] = "networkidle",
         timeout: float = 30000,
-    ) -> None:
+    ) -> Awaitable[None]:
         """Wait for page to reach specified load state."""
         self._ensure_started()
-        await self.page.wait_for_load_state(state, timeout=timeout)
+        return self.page.wait_for_load_state(state, timeout=timeout)
 
     async def wait_for_selector(
         self,
@@ -193,6 +543,85 @@ class SimpleBrowser:
         except PlaywrightTimeout:
             return False
 
+    async def wait_for_selector_fast(
+        self,
+        selector: str,
+        state: Literal["attached", "detached", "visible", "hidden"] = "visible",
+        timeout: float = 10000,
+    ) -> bool:
+        """
+        Wait for a CSS selector using an in-page MutationObserver.
+
+        Resolves as soon as the DOM changes into the requested state instead of on
+        Playwright's polling intervals. A short interval check covers state-only changes
+        (e.g. ancestor visibility via stylesheet) that don't produce mutations.
+        Non-CSS selectors (text=, xpath=, >> chains) and evaluation failures such as a
+        navigation mid-wait fall back to Playwright's own wait for the time remaining.
+
+        Opt-in: document.querySelector does not pierce shadow roots the way Playwright's
+        CSS engine does, so prefer wait_for_selector for components using shadow DOM.
+        """
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout / 1000
+        try:
+            matched = await self.page.evaluate(_WAIT_FOR_SELECTOR_JS, [selector, state, timeout])
+        except Exception as e:
+            self.logger.debug(f"Fast selector wait failed for {selector!r}, falling back: {e}")
+            matched = None
+
+        if matched is not None:
+            return bool(matched)
+
+        remaining = (deadline - loop.time()) * 1000
+        if remaining <= 0:
+            return False
+        try:
+            await self.page.wait_for_selector(selector, state=state, timeout=remaining)
+            return True
+        except PlaywrightTimeout:
+            return False
+
+    async def wait_for_condition(self, predicate_js: str, timeout: float = 10000) -> bool:
+        """
+        Wait until a JS predicate (e.g. "() => document.title === 'Done'") is truthy.
+
+        The predicate is only re-evaluated when the page's DOM revision counter (or URL)
+        has changed since the last check, so a quiet page costs one tiny evaluate per tick.
+        The tick backs off from 50ms to 500ms while nothing changes and resets on change.
+        Predicates that depend on non-DOM state should use a plain polling loop instead.
+        Returns True if the condition was met before the timeout.
+        """
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout / 1000
+        interval = 0.05
+        last_state: Any = None
+        while True:
+            try:
+                rev = await self.page.evaluate(_DOM_REVISION_READ_JS)
+                if rev is None:
+                    # First check on this document: start counting mutations from here.
+                    await self.page.evaluate(_DOM_REVISION_JS)
+                state = (self.page.url, rev)
+                if rev is None or state != last_state:
+                    last_state = state
+                    interval = 0.05
+                    if await self.page.evaluate(predicate_js):
+                        return True
+                else:
+                    interval = min(interval * 2, 0.5)
+            except Exception as e:
+                if not _is_navigation_error(e):
+                    raise  # a broken predicate should fail loudly, not look like a timeout
+                # Execution context destroyed by a navigation; re-check on the new page.
+                self.logger.debug(f"wait_for_condition check failed: {e}")
+                last_state = None
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(interval, remaining))
+
     async def wait_for_navigation(self, timeout: float = 30000) -> None:
         """Wait for navigation to complete."""
         self._ensure_started()
@@ -212,58 +641,75 @@ class SimpleBrowser:
     # Screenshots
     # ─────────────────────────────────────────────────────────────────────────
 
-    async def screenshot(self, full_page: bool = False) -> bytes:
-        """Take a screenshot, hiding debug overlays."""
+    async def screenshot(self, full_page: bool = False, fast: bool = False) -> bytes:
+        """Take a screenshot, hiding debug overlays.
+
+        With fast=True on Chromium the viewport is captured as JPEG (quality 80)
+        straight over CDP; other engines and full-page shots use page.screenshot().
+        """
         self._ensure_started()
         overlay_was_visible = False
         marker_was_visible = False
 
         try:
-            # Hide overlays for clean screenshot
-            if self.show_overlay and self._overlay_created:
+            # Hide overlays for clean screenshot; the two elements are independent,
+            # so both toggles go out concurrently.
+            hide_overlay = self.show_overlay and self._overlay_created
+            hide_marker = self.show_click_markers and self._marker_created
+            if hide_overlay and hide_marker:
+                overlay_was_visible, marker_was_visible = await asyncio.gather(
+                    self._toggle_overlay(False), self._toggle_marker(False)
+                )
+            elif hide_overlay:
                 overlay_was_visible = await self._toggle_overlay(False)
-            if self.show_click_markers and self._marker_created:
+            elif hide_marker:
                 marker_was_visible = await self._toggle_marker(False)
 
-            shot = await self.page.screenshot(full_page=full_page)
+            if fast and not full_page and self.browser_type == "chromium":
+                shot = await self._cdp_screenshot()
+            else:
+                shot = await self.page.screenshot(full_page=full_page)
 
             # Restore overlays
+            restore = []
             if overlay_was_visible:
-                await self._toggle_overlay(True)
+                restore.append(self._toggle_overlay(True))
             if marker_was_visible:
-                await self._toggle_marker(True)
+                restore.append(self._toggle_marker(True))
+            if restore:
+                await asyncio.gather(*restore)
 
             return shot
         except Exception as e:
             raise ScreenshotError(f"Screenshot failed: {e}") from e
 
+    async def _cdp_session(self) -> CDPSession:
+        """CDP session for the current page (Chromium only), reopened after a tab switch."""
+        if self._cdp is None or self._cdp_page is not self.page:
+            self._cdp = await self.context.new_cdp_session(self.page)
+            self._cdp_page = self.page
+        return self._cdp
+
+    async def _cdp_screenshot(self) -> bytes:
+        """Capture the viewport as JPEG via Page.captureScreenshot."""
+        cdp = await self._cdp_session()
+        raw = await cdp.send(
+            "Page.captureScreenshot",
+            {"format": "jpeg", "quality": 80, "captureBeyondViewport": False},
+        )
+        return base64.b64decode(raw["data"])
+
     async def _toggle_overlay(self, visible: bool) -> bool:
         """Toggle overlay visibility, returns previous state."""
         try:
-            return await self.page.evaluate(
-                f"""() => {{
-                    const el = document.getElementById('fara-debug-overlay');
-                    if (!el) return false;
-                    const wasVisible = el.style.display !== 'none';
-                    el.style.display = '{'flex' if visible else 'none'}';
-                    return wasVisible;
-                }}"""
-            )
+            return await self.page.evaluate(_TOGGLE_JS, ["fara-debug-overlay", visible, "flex"])
         except Exception:
             return False
 
     async def _toggle_marker(self, visible: bool) -> bool:
         """Toggle click marker visibility, returns previous state."""
         try:
-            return await self.page.evaluate(
-                f"""() => {{
-                    const el = document.getElementById('fara-click-marker');
-                    if (!el) return false;
-                    const wasVisible = el.style.display !== 'none';
-                    el.style.display = '{'block' if visible else 'none'}';
-                    return wasVisible;
-                }}"""
-            )
+            return await self.page.evaluate(_TOGGLE_JS, ["fara-click-marker", visible, "block"])
         except Exception:
             return False
 
@@ -275,76 +721,14 @@ class SimpleBrowser:
         """Get detailed info about element at coordinates for pre-flight validation."""
         self._ensure_started()
         try:
-            return await self.page.evaluate(
-                """([vx, vy]) => {
-                    const el = document.elementFromPoint(vx, vy);
-                    if (!el) return { found: false };
-                    
-                    const rect = el.getBoundingClientRect();
-                    const style = window.getComputedStyle(el);
-                    const isVisible = style.display !== 'none' 
-                        && style.visibility !== 'hidden' 
-                        && style.opacity !== '0'
-                        && rect.width > 0 
-                        && rect.height > 0;
-                    
-                    const isDisabled = el.disabled === true 
-                        || el.getAttribute('aria-disabled') === 'true';
-                    
-                    const isInteractable = isVisible && !isDisabled 
-                        && style.pointerEvents !== 'none';
-                    
-                    return {
-                        found: true,
-                        tag: (el.tagName || '').toLowerCase(),
-                        type: (el.type || '').toLowerCase(),
-                        id: el.id || '',
-                        className: el.className || '',
-                        role: el.getAttribute('role') || '',
-                        ariaLabel: el.getAttribute('aria-label') || '',
-                        ariaChecked: el.getAttribute('aria-checked'),
-                        checked: 'checked' in el ? !!el.checked : null,
-                        disabled: isDisabled,
-                        text: (el.innerText || '').trim().slice(0, 200),
-                        placeholder: el.placeholder || '',
-                        value: el.value || '',
-                        href: el.href || '',
-                        isVisible,
-                        isInteractable,
-                        rect: { x: rect.x, y: rect.y, width: rect.width, height: rect.height },
-                        selector: _buildSelector(el),
-                    };
-                    
-                    function _buildSelector(elem) {
-                        if (elem.id) return '#' + elem.id;
-                        let path = [];
-                        while (elem && elem.nodeType === Node.ELEMENT_NODE) {
-                            let selector = elem.tagName.toLowerCase();
-                            if (elem.id) {
-                                selector = '#' + elem.id;
-                                path.unshift(selector);
-                                break;
-                            }
-                            let sib = elem, nth = 1;
-                            while (sib = sib.previousElementSibling) {
-                                if (sib.tagName === elem.tagName) nth++;
-                            }
-                            if (nth > 1) selector += ':nth-of-type(' + nth + ')';
-                            path.unshift(selector);
-                            elem = elem.parentElement;
-                        }
-                        return path.join(' > ');
-                    }
-                }""",
-                [x, y],
-            )
+            return await self.page.evaluate(_GET_ELEMENT_AT_JS, [x, y])
         except Exception as e:
             self.logger.warning(f"Failed to get element at ({x}, {y}): {e}")
             return {"found": False}
 
-    async def validate_click_target(self, x: float, y: float) -> tuple[bool, str]:
-        """Validate that coordinates point to a clickable element."""
-        element = await self.get_element_at(x, y)
+    @staticmethod
+    def _check_click_target(element: dict[str, Any]) -> tuple[bool, str]:
+        """Judge an element description from get_element_at as a click target."""
         if not element.get("found"):
             return False, "No element found at coordinates"
         if not element.get("isVisible"):
@@ -353,24 +737,38 @@ class SimpleBrowser:
             return False, f"Element is not interactable: {element.get('tag')}, disabled={element.get('disabled')}"
         return True, f"Valid target: {element.get('tag')} {element.get('text', '')[:30]}"
 
+    async def validate_click_target(self, x: float, y: float) -> tuple[bool, str]:
+        """Validate that coordinates point to a clickable element."""
+        return self._check_click_target(await self.get_element_at(x, y))
+
     async def click(
         self,
         x: float,
         y: float,
         validate: bool = False,
         retry_offsets: list[tuple[float, float]] | None = None,
+        describe_after: bool = True,
     ) -> dict[str, Any]:
-        """Click at coordinates with optional validation and self-healing retries."""
+        """
+        Click at coordinates with optional validation and self-healing retries.
+
+        Validation and description share one evaluate per probed point. With
+        describe_after=False the post-click element lookup is skipped and the pre-click
+        description is returned instead (empty when not validating).
+        """
         self._ensure_started()
 
+        element: dict[str, Any] = {}
         if validate:
-            valid, reason = await self.validate_click_target(x, y)
+            element = await self.get_element_at(x, y)
+            valid, reason = self._check_click_target(element)
             if not valid:
                 # Try nearby offsets if provided
                 if retry_offsets:
                     for dx, dy in retry_offsets:
                         alt_x, alt_y = x + dx, y + dy
-                        valid, reason = await self.validate_click_target(alt_x, alt_y)
+                        element = await self.get_element_at(alt_x, alt_y)
+                        valid, reason = self._check_click_target(element)
                         if valid:
                             x, y = alt_x, alt_y
                             self.logger.info(f"Self-healing: adjusted click to ({x}, {y})")
@@ -380,25 +778,35 @@ class SimpleBrowser:
 
         await self.page.mouse.click(x, y)
 
+        if not describe_after:
+            return element
         # Return element info for logging
         return await self.get_element_at(x, y)
 
-    async def double_click(self, x: float, y: float) -> dict[str, Any]:
-        """Double-click at coordinates."""
+    async def double_click(
+        self, x: float, y: float, describe_after: bool = True
+    ) -> dict[str, Any]:
+        """Double-click at coordinates; with describe_after=False no element lookup is made."""
         self._ensure_started()
         await self.page.mouse.dblclick(x, y)
+        if not describe_after:
+            return {}
         return await self.get_element_at(x, y)
 
-    async def right_click(self, x: float, y: float) -> dict[str, Any]:
-        """Right-click (context menu) at coordinates."""
+    async def right_click(
+        self, x: float, y: float, describe_after: bool = True
+    ) -> dict[str, Any]:
+        """Right-click (context menu) at coordinates; see double_click for describe_after."""
         self._ensure_started()
         await self.page.mouse.click(x, y, button="right")
+        if not describe_after:
+            return {}
         return await self.get_element_at(x, y)
 
-    async def hover(self, x: float, y: float) -> None:
+    def hover(self, x: float, y: float) -> Awaitable[None]:
         """Move cursor without clicking."""
         self._ensure_started()
-        await self.page.mouse.move(x, y)
+        return self.page.mouse.move(x, y)
 
     async def drag_and_drop(
         self,
@@ -410,10 +818,11 @@ class SimpleBrowser:
     ) -> None:
         """Drag from start coordinates to end coordinates."""
         self._ensure_started()
-        await self.page.mouse.move(start_x, start_y)
-        await self.page.mouse.down()
-        await self.page.mouse.move(end_x, end_y, steps=steps)
-        await self.page.mouse.up()
+        mouse = self.page.mouse
+        await mouse.move(start_x, start_y)
+        await mouse.down()
+        await mouse.move(end_x, end_y, steps=steps)
+        await mouse.up()
 
     # ─────────────────────────────────────────────────────────────────────────
     # Keyboard input
@@ -428,28 +837,77 @@ class SimpleBrowser:
     ) -> None:
         """Type text, optionally clearing existing input."""
         self._ensure_started()
+        keyboard = self.page.keyboard
         if delete_existing_text:
-            await self.page.keyboard.press("Control+A")
-            await self.page.keyboard.press("Backspace")
-        await self.page.keyboard.type(text, delay=delay)
+            await keyboard.press("Control+A")
+            await keyboard.press("Backspace")
+        await keyboard.type(text, delay=delay)
         if press_enter:
-            await self.page.keyboard.press("Enter")
+            await keyboard.press("Enter")
 
-    async def press_key(self, key: str) -> None:
+    def press_key(self, key: str) -> Awaitable[None]:
         """Press a keyboard key."""
         self._ensure_started()
-        await self.page.keyboard.press(key)
+        return self.page.keyboard.press(key)
 
     async def press_keys(self, keys: list[str]) -> None:
-        """Press multiple keys in sequence."""
+        """Press multiple keys in sequence.
+
+        Consecutive single printable characters are sent with one keyboard.type call.
+        On Chromium, consecutive plain named keys ("Tab", "Enter", arrows, ...) are sent
+        as raw CDP key events pipelined in one gather instead of one press() round-trip
+        each. Chords ("Control+A"), other keys and other engines use keyboard.press.
+        """
         self._ensure_started()
+        keyboard = self.page.keyboard
+        pipeline = self.browser_type == "chromium"
+        chars: list[str] = []
+        named: list[str] = []
+
+        async def flush() -> None:
+            if chars:
+                await keyboard.type("".join(chars))
+                chars.clear()
+            if named:
+                cdp = await self._cdp_session()
+                # Sent in order on one session; only the acks are awaited together.
+                await asyncio.gather(*(
+                    cdp.send("Input.dispatchKeyEvent", event)
+                    for key in named
+                    for event in _cdp_key_events(key)
+                ))
+                named.clear()
+
         for key in keys:
-            await self.page.keyboard.press(key)
+            if len(key) == 1 and key.isprintable():
+                if named:
+                    await flush()
+                chars.append(key)
+            elif pipeline and key in _CDP_KEYS:
+                if chars:
+                    await flush()
+                named.append(key)
+            else:
+                await flush()
+                await keyboard.press(key)
+        await flush()
 
     # ─────────────────────────────────────────────────────────────────────────
     # Form interactions
     # ─────────────────────────────────────────────────────────────────────────
 
+    async def _element_handle_at(self, x: float, y: float) -> ElementHandle:
+        """Resolve the element at viewport coords to a handle Playwright can act on directly.
+
+        The caller owns the handle and must dispose() it when done.
+        """
+        js_handle = await self.page.evaluate_handle(_ELEMENT_FROM_POINT_JS, [x, y])
+        handle = js_handle.as_element()
+        if handle is None:
+            await js_handle.dispose()
+            raise ElementNotFoundError("No element found at coordinates", coordinates=(x, y))
+        return handle
+
     async def select_option(
         self,
         x: float,
@@ -460,11 +918,8 @@ class SimpleBrowser:
     ) -> list[str]:
         """Select option from dropdown at coordinates."""
         self._ensure_started()
-        element = await self.get_element_at(x, y)
-        selector = element.get("selector")
-
-        if not selector:
-            raise ElementNotFoundError("Could not build selector for element", coordinates=(x, y))
+        # Act on the handle itself instead of building a selector and re-resolving it.
+        handle = await self._element_handle_at(x, y)
 
         select_args: dict[str, Any] = {}
         if value is not None:
@@ -474,76 +929,67 @@ class SimpleBrowser:
         elif index is not None:
             select_args["index"] = index
 
-        return await self.page.select_option(selector, **select_args)
+        try:
+            return await handle.select_option(**select_args)
+        finally:
+            await handle.dispose()
 
     async def file_upload(self, x: float, y: float, file_paths: list[str]) -> None:
         """Upload files to file input at coordinates."""
         self._ensure_started()
-        element = await self.get_element_at(x, y)
-
-        if element.get("tag") != "input" or element.get("type") != "file":
-            raise ElementNotInteractableError(
-                "Element is not a file input",
-                coordinates=(x, y),
-                reason=f"Found {element.get('tag')} type={element.get('type')}",
-            )
+        handle = await self._element_handle_at(x, y)
+        try:
+            tag, input_type = await handle.evaluate(_INPUT_KIND_JS)
 
-        selector = element.get("selector")
-        if not selector:
-            raise ElementNotFoundError("Could not build selector for file input", coordinates=(x, y))
+            if tag != "input" or input_type != "file":
+                raise ElementNotInteractableError(
+                    "Element is not a file input",
+                    coordinates=(x, y),
+                    reason=f"Found {tag} type={input_type}",
+                )
 
-        await self.page.set_input_files(selector, file_paths)
+            await handle.set_input_files(file_paths)
+        finally:
+            await handle.dispose()
 
     # ─────────────────────────────────────────────────────────────────────────
     # Scrolling
     # ─────────────────────────────────────────────────────────────────────────
 
-    async def scroll(self, pixels: int) -> None:
+    def scroll(self, pixels: int) -> Awaitable[None]:
         """Scroll the page (positive=up, negative=down)."""
         self._ensure_started()
-        await self.page.mouse.wheel(0, -pixels)
+        return self.page.mouse.wheel(0, -pixels)
 
-    async def page_up(self) -> None:
+    def page_up(self) -> Awaitable[None]:
         """Scroll up one page via keyboard."""
         self._ensure_started()
-        await self.page.keyboard.press("PageUp")
+        return self.page.keyboard.press("PageUp")
 
-    async def page_down(self) -> None:
+    def page_down(self) -> Awaitable[None]:
         """Scroll down one page via keyboard."""
         self._ensure_started()
-        await self.page.keyboard.press("PageDown")
+        return self.page.keyboard.press("PageDown")
 
-    async def scroll_to_top(self) -> None:
-        """Scroll to top of page."""
+    async def scroll_to_top(self) -> dict[str, Any]:
+        """Scroll to top of page and return the resulting scroll position."""
         self._ensure_started()
-        await self.page.evaluate("window.scrollTo(0, 0)")
+        return await self.page.evaluate(_SCROLL_TO_JS, False)
+
+    async def scroll_to_bottom(self) -> dict[str, Any]:
+        """Scroll to bottom of page and return the resulting scroll position.
 
-    async def scroll_to_bottom(self) -> None:
-        """Scroll to bottom of page."""
+        Measuring in the same evaluate avoids a second round-trip and the race where
+        lazy-loaded content changes the height between scrolling and measuring.
+        """
         self._ensure_started()
-        await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        return await self.page.evaluate(_SCROLL_TO_JS, True)
 
     async def get_scroll_position(self) -> dict[str, Any]:
         """Return scroll position info for the current page."""
         self._ensure_started()
         try:
-            return await self.page.evaluate(
-                """() => {
-                    const y = window.scrollY || 0;
-                    const x = window.scrollX || 0;
-                    const h = Math.max(
-                        document.body.scrollHeight || 0,
-                        document.documentElement.scrollHeight || 0
-                    );
-                    const w = Math.max(
-                        document.body.scrollWidth || 0,
-                        document.documentElement.scrollWidth || 0
-                    );
-                    const vh = window.innerHeight || 1;
-                    const vw = window.innerWidth || 1;
-                    return { x, y, scrollHeight: h, scrollWidth: w, viewportH: vh, viewportW: vw };
-                }"""
-            )
+            return await self.page.evaluate(_SCROLL_POSITION_JS)
         except Exception:
             return {"x": 0, "y": 0, "scrollHeight": 0, "scrollWidth": 0, "viewportH": 0, "viewportW": 0}
 
@@ -551,20 +997,20 @@ class SimpleBrowser:
     # Navigation controls
     # ─────────────────────────────────────────────────────────────────────────
 
-    async def go_back(self) -> None:
+    def go_back(self) -> Awaitable[Any]:
         """Go back in history."""
         self._ensure_started()
-        await self.page.go_back()
+        return self.page.go_back()
 
-    async def go_forward(self) -> None:
+    def go_forward(self) -> Awaitable[Any]:
         """Go forward in history."""
         self._ensure_started()
-        await self.page.go_forward()
+        return self.page.go_forward()
 
-    async def reload(self) -> None:
+    def reload(self) -> Awaitable[Any]:
         """Reload the page."""
         self._ensure_started()
-        await self.page.reload()
+        return self.page.reload()
 
     def get_url(self) -> str:
         """Get current URL."""
@@ -619,6 +1065,7 @@ class SimpleBrowser:
         """Open a new page/tab and switch to it."""
         self._ensure_started()
         self.page = await self.context.new_page()
+        await self._setup_page()
         return self.page
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -629,12 +1076,7 @@ class SimpleBrowser:
         """Return a snippet of the page body text."""
         self._ensure_started()
         try:
-            text = await self.page.evaluate(
-                """() => {
-                    const t = document.body?.innerText || "";
-                    return t.slice(0, 1200);
-                }"""
-            )
+            text = await self.page.evaluate(_BODY_TEXT_JS)
             return text[:max_len]
         except Exception:
             return ""
@@ -649,13 +1091,22 @@ class SimpleBrowser:
             self.logger.warning(f"Failed to get accessibility tree: {e}")
             return {}
 
+    @property
+    def console_messages(self) -> tuple[dict[str, Any], ...]:
+        """Read-only snapshot of captured console messages, rebuilt only after new ones arrive."""
+        if self._console_snapshot_version != self._console_version:
+            self._console_snapshot = tuple(self._console_messages)
+            self._console_snapshot_version = self._console_version
+        return self._console_snapshot
+
     def get_console_messages(self) -> list[dict[str, Any]]:
-        """Get captured console messages."""
-        return self._console_messages.copy()
+        """Get captured console messages as a new list (prefer `console_messages` for reads)."""
+        return list(self._console_messages)
 
     def clear_console_messages(self) -> None:
         """Clear captured console messages."""
         self._console_messages.clear()
+        self._console_version += 1
 
     # Legacy method for backward compatibility
     async def describe_element_at(self, x: float, y: float) -> dict[str, Any]:
@@ -667,76 +1118,17 @@ class SimpleBrowser:
     # ─────────────────────────────────────────────────────────────────────────
 
     async def _setup_overlay_init_script(self) -> None:
-        """Add init script for overlay persistence across navigations."""
-        await self.page.add_init_script(
-            """() => {
-                if (document.getElementById('fara-debug-overlay')) return;
-                const el = document.createElement('div');
-                el.id = 'fara-debug-overlay';
-                el.style.cssText = `
-                    position: fixed; bottom: 8px; right: 8px; max-width: 42vw;
-                    padding: 10px 12px; border-radius: 10px;
-                    font: 12px/1.45 "Fira Code", Menlo, Consolas, monospace;
-                    color: #e9f5ff;
-                    background: linear-gradient(145deg, rgba(12,17,28,0.92), rgba(20,32,52,0.9));
-                    border: 1px solid rgba(255,255,255,0.14);
-                    z-index: 2147483647; pointer-events: none;
-                    box-shadow: 0 8px 20px rgba(0,0,0,0.45);
-                    white-space: pre-wrap; backdrop-filter: blur(6px);
-                    max-height: 42vh; overflow: hidden;
-                    display: flex; flex-direction: column; gap: 4px; text-align: left;
-                `;
-                el.textContent = 'Fara debug overlay ready.';
-                document.body?.appendChild(el);
-            }"""
-        )
-
-    async def _inject_overlay(self) -> None:
-        """Inject a debug overlay for headful debugging."""
-        try:
-            created = await self.page.evaluate(
-                """() => {
-                    const existing = document.getElementById('fara-debug-overlay');
-                    if (existing) return true;
-                    const el = document.createElement('div');
-                    el.id = 'fara-debug-overlay';
-                    el.style.cssText = `
-                        position: fixed; bottom: 8px; right: 8px; max-width: 42vw;
-                        padding: 10px 12px; border-radius: 10px;
-                        font: 12px/1.45 "Fira Code", Menlo, Consolas, monospace;
-                        color: #e9f5ff;
-                        background: linear-gradient(145deg, rgba(12,17,28,0.92), rgba(20,32,52,0.9));
-                        border: 1px solid rgba(255,255,255,0.14);
-                        z-index: 2147483647; pointer-events: none;
-                        box-shadow: 0 8px 20px rgba(0,0,0,0.45);
-                        white-space: pre-wrap; backdrop-filter: blur(6px);
-                        max-height: 42vh; overflow: hidden;
-                        display: flex; flex-direction: column; gap: 4px; text-align: left;
-                    `;
-                    el.textContent = 'Fara debug overlay ready.';
-                    document.body?.appendChild(el);
-                    return true;
-                }"""
-            )
-            self._overlay_created = bool(created)
-        except Exception as e:
-            self.logger.warning(f"Failed to inject overlay: {e}")
+        """Add init script that mounts the overlay on every new document."""
+        await self.page.add_init_script(_OVERLAY_JS)
+        self._overlay_created = True
 
     async def update_overlay(self, text: str) -> None:
         """Update debug overlay text."""
         if not self.show_overlay:
             return
         self._last_overlay_text = text
-        if not self._overlay_created:
-            await self._inject_overlay()
         try:
-            await self.page.evaluate(
-                """(msg) => {
-                    let el = document.getElementById('fara-debug-overlay');
-                    if (el) el.textContent = msg;
-                }""",
-                text[:800],
-            )
+            await self.page.evaluate(_SET_OVERLAY_TEXT_JS, text[:800])
         except Exception as e:
             self.logger.warning(f"Failed to update overlay: {e}")
 
@@ -746,95 +1138,139 @@ class SimpleBrowser:
             await self.update_overlay(self._last_overlay_text)
 
     async def _setup_click_marker_init_script(self) -> None:
-        """Add init script for click marker persistence."""
-        await self.page.add_init_script(
-            """() => {
-                if (document.getElementById('fara-click-marker')) return;
-                const el = document.createElement('div');
-                el.id = 'fara-click-marker';
-                el.style.cssText = `
-                    position: fixed; width: 30px; height: 30px; border-radius: 50%;
-                    border: 2px solid #5bd1ff;
-                    box-shadow: 0 0 12px rgba(91,209,255,0.65);
-                    background: rgba(91,209,255,0.15);
-                    z-index: 2147483647; pointer-events: none;
-                    transform: translate(-50%, -50%); display: none;
-                `;
-                const label = document.createElement('div');
-                label.id = 'fara-click-marker-label';
-                label.style.cssText = `
-                    position: absolute; bottom: -14px; left: 50%;
-                    transform: translateX(-50%);
-                    font: 11px/1.2 "Fira Code", Menlo, Consolas, monospace;
-                    padding: 2px 6px; border-radius: 6px;
-                    background: rgba(0,0,0,0.7); color: #e9f5ff;
-                    white-space: nowrap; box-shadow: 0 2px 6px rgba(0,0,0,0.35);
-                `;
-                label.textContent = 'click';
-                el.appendChild(label);
-                document.body?.appendChild(el);
-            }"""
-        )
-
-    async def _inject_click_marker(self) -> None:
-        """Ensure the click marker element exists."""
-        try:
-            created = await self.page.evaluate(
-                """() => {
-                    let el = document.getElementById('fara-click-marker');
-                    if (el) return true;
-                    el = document.createElement('div');
-                    el.id = 'fara-click-marker';
-                    el.style.cssText = `
-                        position: fixed; width: 30px; height: 30px; border-radius: 50%;
-                        border: 2px solid #5bd1ff;
-                        box-shadow: 0 0 12px rgba(91,209,255,0.65);
-                        background: rgba(91,209,255,0.15);
-                        z-index: 2147483647; pointer-events: none;
-                        transform: translate(-50%, -50%); display: none;
-                    `;
-                    const label = document.createElement('div');
-                    label.id = 'fara-click-marker-label';
-                    label.style.cssText = `
-                        position: absolute; bottom: -14px; left: 50%;
-                        transform: translateX(-50%);
-                        font: 11px/1.2 "Fira Code", Menlo, Consolas, monospace;
-                        padding: 2px 6px; border-radius: 6px;
-                        background: rgba(0,0,0,0.7); color: #e9f5ff;
-                        white-space: nowrap; box-shadow: 0 2px 6px rgba(0,0,0,0.35);
-                    `;
-                    label.textContent = 'click';
-                    el.appendChild(label);
-                    document.body?.appendChild(el);
-                    return true;
-                }"""
-            )
-            self._marker_created = bool(created)
-        except Exception as e:
-            self.logger.warning(f"Failed to inject click marker: {e}")
+        """Add a context-wide init script defining the click-marker function for every document."""
+        await self.context.add_init_script(_CLICK_MARKER_JS)
+        self._marker_created = True
 
     async def show_click_marker(self, x: float, y: float, label: str = "click") -> None:
         """Show a transient click marker at viewport coords."""
         if not self.show_click_markers:
             return
-        if not self._marker_created:
-            await self._inject_click_marker()
         try:
-            await self.page.evaluate(
-                """([vx, vy, lbl]) => {
-                    const el = document.getElementById('fara-click-marker');
-                    if (!el) return;
-                    const labelEl = el.querySelector('#fara-click-marker-label');
-                    if (labelEl) labelEl.textContent = lbl || 'click';
-                    el.style.left = `${vx}px`;
-                    el.style.top = `${vy}px`;
-                    el.style.display = 'block';
-                    setTimeout(() => {
-                        const el2 = document.getElementById('fara-click-marker');
-                        if (el2) el2.style.display = 'none';
-                    }, 1000);
-                }""",
-                [x, y, label[:24]],
-            )
+            await self.page.evaluate(_SHOW_CLICK_MARKER_JS, [x, y, label[:24]])
         except Exception as e:
             self.logger.warning(f"Failed to show click marker: {e}")
+
+    def set_pending_click_marker(self, x: float, y: float, label: str = "click") -> None:
+        """Set the click marker shown by the next flush_click_marker() call.
+
+        The page has a single marker element, so a later call replaces the pending one.
+        """
+        if self.show_click_markers:
+            self._pending_marker = (x, y, label)
+
+    async def flush_click_marker(self) -> None:
+        """Show the pending click marker, if any, with a single evaluate."""
+        if self._pending_marker is None:
+            return
+        x, y, label = self._pending_marker
+        self._pending_marker = None
+        await self.show_click_marker(x, y, label)
+
+
+class BrowserPool:
+    """
+    Keep launched browsers warm across test runs.
+
+    Launching the browser process dominates SimpleBrowser startup. The pool lends an
+    already-launched Browser to a SimpleBrowser, which then only opens a fresh
+    BrowserContext and Page. Contexts are never reused, so cookies and storage do not
+    leak between tests.
+    """
+
+    def __init__(
+        self,
+        browser_type: BrowserType = "firefox",
+        headless: bool = True,
+        slow_mo: int = 0,
+        max_concurrency: int = 1,
+        logger: Optional[logging.Logger] = None,
+    ):
+        _check_browser_type(browser_type)
+        self.browser_type = browser_type
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self.size = max(1, min(os.cpu_count() or 1, max_concurrency))
+        self.logger = logger or logging.getLogger("browser")
+        self._playwright: Optional[Playwright] = None
+        self._idle: list[Browser] = []
+        self._launched: list[Browser] = []
+        self._slots = asyncio.BoundedSemaphore(self.size)
+
+    async def __aenter__(self) -> "BrowserPool":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _launch(self) -> Browser:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        launch_options: dict[str, Any] = {"headless": self.headless}
+        if self.slow_mo > 0:
+            launch_options["slow_mo"] = self.slow_mo
+        browser = await getattr(self._playwright, self.browser_type).launch(**launch_options)
+        self._launched.append(browser)
+        return browser
+
+    async def acquire(self, browser: SimpleBrowser) -> SimpleBrowser:
+        """Start `browser` on a pooled browser process, waiting for a free slot."""
+        if browser.browser_type != self.browser_type or browser.headless != self.headless:
+            raise BrowserError(
+                "Browser settings do not match the pool",
+                {"pool": self.browser_type, "requested": browser.browser_type},
+            )
+        await self._slots.acquire()
+        launched = None
+        try:
+            while self._idle:
+                candidate = self._idle.pop()
+                if candidate.is_connected():
+                    launched = candidate
+                    break
+            if launched is None:
+                launched = await self._launch()
+            browser._playwright = self._playwright
+            browser.browser = launched
+            browser._owns_browser = False
+            await browser.start()
+        except BaseException:
+            await self._detach(browser, launched)
+            raise
+        browser._pool_slot = True
+        return browser
+
+    async def release(self, browser: SimpleBrowser) -> None:
+        """Close the browser's context and return its browser process to the pool."""
+        if not browser._pool_slot:
+            return
+        browser._pool_slot = False
+        await self._detach(browser, browser.browser)
+
+    async def _detach(self, browser: SimpleBrowser, launched: Optional[Browser]) -> None:
+        """Close whatever context `browser` opened and give back its slot and process."""
+        try:
+            await browser.close()
+        except Exception as e:
+            self.logger.warning(f"Failed to close pooled browser context: {e}")
+        finally:
+            browser.page = None
+            browser.context = None
+            browser.browser = None
+            browser._playwright = None
+            if launched is not None and launched.is_connected():
+                self._idle.append(launched)
+            self._slots.release()
+
+    async def close(self) -> None:
+        """Shut down every pooled browser and the shared Playwright driver."""
+        for launched in self._launched:
+            try:
+                await launched.close()
+            except Exception as e:
+                self.logger.warning(f"Failed to close pooled browser: {e}")
+        self._launched.clear()
+        self._idle.clear()
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
@@ -1,11 +1,16 @@
 """Configuration module for Fara E2E agent."""
-from config.models import (
-    AgentConfig,
-    BrowserConfig,
-    ReportingConfig,
-    FaraConfig,
-    load_config,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from config.models import (
+        AgentConfig,
+        BrowserConfig,
+        ReportingConfig,
+        FaraConfig,
+        load_config,
+    )
 
 __all__ = [
     "AgentConfig",
@@ -15,3 +20,11 @@ __all__ = [
     "load_config",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    """Import config.models (pydantic, dotenv) on first use rather than at package import."""
+    if name in __all__:
+        from config import models
+
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
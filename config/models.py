@@ -1,22 +1,63 @@
 """Pydantic configuration models for Fara E2E agent."""
 from __future__ import annotations
 
-import json
 import os
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal, Optional
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, field_validator, model_validator
-
-
-# Load .env file if present
-load_dotenv()
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# .env is read on the first load_config() call rather than at import.
+_dotenv_loaded = False
+
+
+# Legacy flat config format: which section each top-level key belongs to
+# ("" for keys that stay at the root).
+_AGENT_KEYS = frozenset({
+    "model", "base_url", "api_key", "temperature",
+    "max_rounds", "max_tokens", "max_n_images", "debug_log_requests",
+})
+_BROWSER_KEYS = frozenset({
+    "browser", "headless", "viewport_width", "viewport_height",
+    "show_overlay", "show_click_markers", "slow_mo",
+})
+_REPORTING_KEYS = frozenset({
+    "save_screenshots", "screenshots_folder", "reports_folder",
+    "downloads_folder", "output_format", "embed_screenshots",
+})
+_FLAT_KEY_SECTIONS: dict[str, str] = {
+    **dict.fromkeys(_AGENT_KEYS, "agent"),
+    **dict.fromkeys(_BROWSER_KEYS, "browser"),
+    **dict.fromkeys(_REPORTING_KEYS, "reporting"),
+    **dict.fromkeys(("parallel_workers", "verbose", "debug"), ""),
+}
+# Top-level keys that mark a config as the flat format.
+_FLAT_FORMAT_MARKERS = frozenset({"model", "base_url", "api_key"})
+
+# AgentConfig fields that fall back to environment variables; the variables
+# are also part of the load_config cache key.
+_ENV_FIELDS = {
+    "base_url": "FARA_BASE_URL",
+    "api_key": "FARA_API_KEY",
+    "model": "FARA_MODEL",
+}
+_ENV_KEYS = tuple(_ENV_FIELDS.values())
+# Values of _ENV_KEYS read once per load_config call; None outside of one.
+_env_snapshot: ContextVar[Optional[dict[str, Optional[str]]]] = ContextVar(
+    "fara_env_snapshot", default=None
+)
+
+_YAML_SUFFIXES = frozenset({".yaml", ".yml"})
 
 
 class AgentConfig(BaseModel):
     """LLM agent configuration."""
 
+    model_config = ConfigDict(defer_build=True)
+
     model: str = Field(
         default="microsoft_fara-7b",
         description="Model name to use for the LLM",
@@ -62,28 +103,33 @@ class AgentConfig(BaseModel):
     @classmethod
     def validate_base_url(cls, v: str) -> str:
         """Ensure base_url doesn't have trailing slash."""
-        return v.rstrip("/")
+        return v.rstrip("/") if v.endswith("/") else v
 
     @model_validator(mode="before")
     @classmethod
-    def load_from_env(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def load_from_env(cls, data: Any) -> Any:
         """Load values from environment variables if not explicitly set."""
-        env_mapping = {
-            "base_url": "FARA_BASE_URL",
-            "api_key": "FARA_API_KEY",
-            "model": "FARA_MODEL",
-        }
-        for field_name, env_var in env_mapping.items():
-            if field_name not in data or data[field_name] is None:
-                env_value = os.getenv(env_var)
-                if env_value:
-                    data[field_name] = env_value
+        if not isinstance(data, dict):
+            return data
+        missing = [name for name in _ENV_FIELDS if data.get(name) is None]
+        if not missing:
+            # Re-validation of an already-resolved section: no env lookups.
+            return data
+        data = dict(data)
+        env = _env_snapshot.get()
+        for field_name in missing:
+            env_var = _ENV_FIELDS[field_name]
+            env_value = env[env_var] if env is not None else os.getenv(env_var)
+            if env_value:
+                data[field_name] = env_value
         return data
 
 
 class BrowserConfig(BaseModel):
     """Browser automation configuration."""
 
+    model_config = ConfigDict(defer_build=True)
+
     browser: Literal["chromium", "firefox", "webkit"] = Field(
         default="firefox",
         description="Browser engine to use",
@@ -119,19 +165,23 @@ class BrowserConfig(BaseModel):
         description="Slow down browser operations by this many ms",
     )
 
-    @model_validator(mode="after")
-    def set_overlay_defaults(self) -> "BrowserConfig":
+    @model_validator(mode="before")
+    @classmethod
+    def set_overlay_defaults(cls, data: Any) -> Any:
         """Enable overlays by default in headful mode."""
-        if not self.headless:
+        if isinstance(data, dict) and data.get("headless", True) is False:
             # Only set defaults if not explicitly configured
-            object.__setattr__(self, "show_overlay", True)
-            object.__setattr__(self, "show_click_markers", True)
-        return self
+            data = dict(data)
+            data.setdefault("show_overlay", True)
+            data.setdefault("show_click_markers", True)
+        return data
 
 
 class ReportingConfig(BaseModel):
     """Reporting and output configuration."""
 
+    model_config = ConfigDict(defer_build=True)
+
     save_screenshots: bool = Field(
         default=True,
         description="Save screenshots during test execution",
@@ -157,18 +207,12 @@ class ReportingConfig(BaseModel):
         description="Embed screenshots as base64 in HTML reports",
     )
 
-    @field_validator("screenshots_folder", "reports_folder", "downloads_folder", mode="before")
-    @classmethod
-    def convert_to_path(cls, v: Any) -> Path:
-        """Convert string to Path."""
-        if isinstance(v, str):
-            return Path(v)
-        return v
-
 
 class FaraConfig(BaseModel):
     """Root configuration model combining all config sections."""
 
+    model_config = ConfigDict(defer_build=True)
+
     agent: AgentConfig = Field(default_factory=AgentConfig)
     browser: BrowserConfig = Field(default_factory=BrowserConfig)
     reporting: ReportingConfig = Field(default_factory=ReportingConfig)
@@ -189,49 +233,38 @@ class FaraConfig(BaseModel):
         description="Enable debug mode (pause on each step)",
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def nest_flat_format(cls, data: Any) -> Any:
+        """Accept the legacy flat format, recognised by top-level agent keys."""
+        if isinstance(data, dict) and not _FLAT_FORMAT_MARKERS.isdisjoint(data):
+            return cls._nest_flat_dict(data)
+        return data
+
     @classmethod
     def from_flat_dict(cls, data: dict[str, Any]) -> "FaraConfig":
         """Create config from a flat dictionary (legacy format compatibility)."""
-        # Map flat keys to nested structure
-        agent_keys = {
-            "model", "base_url", "api_key", "temperature",
-            "max_rounds", "max_tokens", "max_n_images", "debug_log_requests"
-        }
-        browser_keys = {
-            "browser", "headless", "viewport_width", "viewport_height",
-            "show_overlay", "show_click_markers", "slow_mo"
-        }
-        reporting_keys = {
-            "save_screenshots", "screenshots_folder", "reports_folder",
-            "downloads_folder", "output_format", "embed_screenshots"
-        }
+        return cls.model_validate(cls._nest_flat_dict(data))
 
-        nested = {
+    @staticmethod
+    def _nest_flat_dict(data: dict[str, Any]) -> dict[str, Any]:
+        """Map flat keys to the nested section structure."""
+        nested: dict[str, Any] = {
             "agent": {},
             "browser": {},
             "reporting": {},
         }
 
         for key, value in data.items():
-            if key in agent_keys:
-                nested["agent"][key] = value
-            elif key in browser_keys:
-                nested["browser"][key] = value
-            elif key in reporting_keys:
-                nested["reporting"][key] = value
-            elif key == "parallel_workers":
-                nested["parallel_workers"] = value
-            elif key == "verbose":
-                nested["verbose"] = value
-            elif key == "debug":
-                nested["debug"] = value
-            # Legacy mappings
-            elif key == "screenshots_folder":
-                nested["reporting"]["screenshots_folder"] = value
-            elif key == "downloads_folder":
-                nested["reporting"]["downloads_folder"] = value
-
-        return cls.model_validate(nested)
+            section = _FLAT_KEY_SECTIONS.get(key)
+            if section is None:
+                continue
+            if section:
+                nested[section][key] = value
+            else:
+                nested[key] = value
+
+        return nested
 
 
 def load_config(
@@ -246,40 +279,97 @@ def load_config(
     2. Environment variables
     3. Config file
     4. Defaults
+
+    Results are memoized on (path, file mtime and size, overrides, FARA_* env
+    vars), so repeated loads of an unchanged file skip parsing and validation.
+    Each call returns its own deep copy, since callers mutate the config they get.
     """
-    config_data: dict[str, Any] = {}
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        # Load .env file if present
+        load_dotenv()
+        _dotenv_loaded = True
 
     # Load from file if provided or default exists
     if config_path is None:
         config_path = Path("config.json")
 
-    if config_path.exists():
-        with open(config_path, "r", encoding="utf-8") as f:
-            if config_path.suffix in {".yaml", ".yml"}:
-                import yaml
-                config_data = yaml.safe_load(f) or {}
-            else:
-                config_data = json.load(f)
+    try:
+        stat = config_path.stat()
+        # Size as well as mtime: a rewrite within one mtime tick still changes the key.
+        file_key: Optional[tuple[int, int]] = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        file_key = None
+    overrides = tuple(sorted((cli_overrides or {}).items()))
+    try:
+        hash(overrides)
+        cacheable = True
+    except TypeError:
+        # Unhashable override values: load without the cache.
+        cacheable = False
+    env = {key: os.getenv(key) for key in _ENV_KEYS}
+    token = _env_snapshot.set(env)
+    try:
+        if cacheable:
+            config = _load_config_cached(
+                str(config_path.resolve()), file_key, overrides, tuple(env.values())
+            )
+        else:
+            config = _load_config_uncached(config_path, cli_overrides)
+    finally:
+        _env_snapshot.reset(token)
+    return config.model_copy(deep=True)
+
+
+@lru_cache(maxsize=16)
+def _load_config_cached(
+    config_path: str,
+    file_key: Optional[tuple[int, int]],
+    overrides: tuple[tuple[str, Any], ...],
+    env: tuple[Optional[str], ...],
+) -> FaraConfig:
+    """Cached wrapper around _load_config_uncached; file_key and env only key the cache."""
+    return _load_config_uncached(Path(config_path), dict(overrides))
+
 
-    # Check if it's flat or nested format
-    is_flat = any(key in config_data for key in ["model", "base_url", "api_key"])
+def _load_config_uncached(
+    config_path: Path,
+    cli_overrides: Optional[dict[str, Any]],
+) -> FaraConfig:
+    """Parse and validate the config file, then apply CLI overrides."""
+    config_data: Optional[dict[str, Any]] = {}
 
-    if is_flat:
-        config = FaraConfig.from_flat_dict(config_data)
+    if config_path.exists():
+        raw = config_path.read_bytes()
+        if config_path.suffix in _YAML_SUFFIXES:
+            import yaml
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            config_data = yaml.load(raw, Loader=loader) or {}
+        else:
+            config_data = None
+
+    if config_data is None:
+        # pydantic-core parses and validates JSON in one pass; the flat legacy
+        # format is handled by FaraConfig.nest_flat_format.
+        config = FaraConfig.model_validate_json(raw)
     else:
         config = FaraConfig.model_validate(config_data)
 
     # Apply CLI overrides
     if cli_overrides:
-        config_dict = config.model_dump()
-        _apply_overrides(config_dict, cli_overrides)
-        config = FaraConfig.model_validate(config_dict)
+        config = _apply_overrides(config, cli_overrides)
 
     return config
 
 
-def _apply_overrides(config_dict: dict[str, Any], overrides: dict[str, Any]) -> None:
-    """Apply CLI overrides to config dictionary."""
+def _apply_overrides(config: FaraConfig, overrides: dict[str, Any]) -> FaraConfig:
+    """
+    Apply CLI overrides, returning a new config.
+
+    Only the sections an override touches are dumped and re-validated (so their
+    validators, e.g. headful overlay defaults, still run); untouched sections are
+    passed through as instances, which pydantic does not re-validate.
+    """
     override_mapping = {
         "browser": ("browser", "browser"),
         "headless": ("browser", "headless"),
@@ -291,19 +381,33 @@ def _apply_overrides(config_dict: dict[str, Any], overrides: dict[str, Any]) ->
         "base_url": ("agent", "base_url"),
     }
 
+    section_updates: dict[str, dict[str, Any]] = {}
+    top_level: dict[str, Any] = {}
     for key, value in overrides.items():
         if value is None:
             continue
 
         if key == "headful":
-            config_dict["browser"]["headless"] = not value
+            section_updates.setdefault("browser", {})["headless"] = not value
             continue
 
         mapping = override_mapping.get(key)
         if mapping:
             section, field = mapping
             if field is None:
-                config_dict[section] = value
+                top_level[section] = value
             else:
-                config_dict[section][field] = value
-
+                section_updates.setdefault(section, {})[field] = value
+
+    if not section_updates and not top_level:
+        return config
+
+    data: dict[str, Any] = {name: getattr(config, name) for name in FaraConfig.model_fields}
+    for section, updates in section_updates.items():
+        current = data[section]
+        # Unset fields stay out so "before" validators can still default them.
+        data[section] = type(current).model_validate(
+            {**current.model_dump(exclude_unset=True), **updates}
+        )
+    data.update(top_level)
+    return FaraConfig.model_validate(data)
@@ -1,7 +1,30 @@
 """Custom exception hierarchy for Fara E2E agent."""
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Iterator, Mapping, Optional
+
+
+class _EmptyDetails(Mapping[str, Any]):
+    """Read-only empty mapping; pickles and copies as the shared instance."""
+
+    def __getitem__(self, key: str) -> Any:
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+    def __repr__(self) -> str:
+        return "{}"
+
+    def __reduce__(self) -> str:
+        return "_EMPTY_DETAILS"
+
+
+# Shared read-only details for the common no-details case.
+_EMPTY_DETAILS: Mapping[str, Any] = _EmptyDetails()
 
 
 class FaraError(Exception):
@@ -10,12 +33,18 @@ class FaraError(Exception):
     def __init__(self, message: str, details: Optional[dict[str, Any]] = None):
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self.details: Mapping[str, Any] = details or _EMPTY_DETAILS
+        self._str_cache: Optional[str] = None
 
     def __str__(self) -> str:
-        if self.details:
-            return f"{self.message} | Details: {self.details}"
-        return self.message
+        # Formatted once: exceptions are not mutated after being raised, and
+        # retry loops may log the same error many times.
+        if self._str_cache is None:
+            if self.details:
+                self._str_cache = f"{self.message} | Details: {self.details}"
+            else:
+                self._str_cache = self.message
+        return self._str_cache
 
 
 # Browser-related exceptions
@@ -34,11 +63,7 @@ class NavigationError(BrowserError):
         url: Optional[str] = None,
         timeout: Optional[float] = None,
     ):
-        details = {}
-        if url:
-            details["url"] = url
-        if timeout:
-            details["timeout"] = timeout
+        details = {k: v for k, v in (("url", url), ("timeout", timeout)) if v}
         super().__init__(message, details)
         self.url = url
         self.timeout = timeout
@@ -53,11 +78,7 @@ class ElementNotFoundError(BrowserError):
         coordinates: Optional[tuple[float, float]] = None,
         selector: Optional[str] = None,
     ):
-        details = {}
-        if coordinates:
-            details["coordinates"] = coordinates
-        if selector:
-            details["selector"] = selector
+        details = {k: v for k, v in (("coordinates", coordinates), ("selector", selector)) if v}
         super().__init__(message, details)
         self.coordinates = coordinates
         self.selector = selector
@@ -72,11 +93,7 @@ class ElementNotInteractableError(BrowserError):
         coordinates: Optional[tuple[float, float]] = None,
         reason: Optional[str] = None,
     ):
-        details = {}
-        if coordinates:
-            details["coordinates"] = coordinates
-        if reason:
-            details["reason"] = reason
+        details = {k: v for k, v in (("coordinates", coordinates), ("reason", reason)) if v}
         super().__init__(message, details)
         self.coordinates = coordinates
         self.reason = reason
@@ -157,11 +174,7 @@ class TaskValidationError(TestDefinitionError):
     """Raised when a task definition is invalid."""
 
     def __init__(self, message: str, task_id: Optional[str] = None, field: Optional[str] = None):
-        details = {}
-        if task_id:
-            details["task_id"] = task_id
-        if field:
-            details["field"] = field
+        details = {k: v for k, v in (("task_id", task_id), ("field", field)) if v}
         super().__init__(message, details)
         self.task_id = task_id
         self.field = field
@@ -191,11 +204,7 @@ class LoopDetectedError(TestExecutionError):
     """Raised when agent detects it's stuck in a loop."""
 
     def __init__(self, message: str, action: Optional[str] = None, count: Optional[int] = None):
-        details = {}
-        if action:
-            details["action"] = action
-        if count:
-            details["repeat_count"] = count
+        details = {k: v for k, v in (("action", action), ("repeat_count", count)) if v}
         super().__init__(message, details)
         self.action = action
         self.count = count
@@ -3,6 +3,22 @@
 This module is kept for backward compatibility.
 New code should use `from reporters import HTMLReporter` directly.
 """
-from reporters.html import HTMLReporter, build_report
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from reporters.html import HTMLReporter, build_report
 
 __all__ = ["HTMLReporter", "build_report"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import reporters.html only when one of its names is first read."""
+    if name in __all__:
+        from reporters import html
+
+        value = getattr(html, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
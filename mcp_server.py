@@ -10,38 +10,44 @@ Transport: stdio (local-first).
 """
 from __future__ import annotations
 
+import inspect
 import json
 import logging
 import os
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, Optional
 
 import mcp.types as types
 from mcp.server import InitializationOptions, Server
 from mcp.server.stdio import stdio_server
-from mcp.server.sse import SseServerTransport
 import anyio
 from logging.handlers import RotatingFileHandler
 import asyncio
-from starlette.applications import Starlette
-from starlette.routing import Route, Mount
-from starlette.responses import Response
-import uvicorn
 
+# HTTP transport (uvicorn/starlette), the runner (Playwright) and reporters are
+# imported where they are used, so stdio startup doesn't pay for them.
 from config import load_config
-from reporters import HTMLReporter, JSONReporter
 from task_loader import discover_tasks, load_task_file, validate_task
-from test_runner import E2ETestRunner
 from test_types import TestCase, TestRunResult
 from exceptions import TaskValidationError
 
+try:
+    import orjson
+except ImportError:  # optional: faster run index encoding
+    orjson = None
+
 logger = logging.getLogger("fara_mcp")
 logger.propagate = False
 LOG_FILE = Path(__file__).with_name("mcp_server.log")
 
-ROOT = Path(__file__).parent
+# Resolved once so every derived path is absolute and _file_uri can skip resolve().
+ROOT = Path(__file__).resolve().parent
 TASKS_DIR = ROOT / "tasks"
 GENERATED_TASKS_DIR = TASKS_DIR / "generated"
 REPORTS_DIR = ROOT / "reports"
@@ -49,18 +55,74 @@ SCREENSHOTS_DIR = ROOT / "screenshots"
 RUN_INDEX_PATH = REPORTS_DIR / "run_index.json"
 
 
+def _run_concurrency() -> int:
+    """Concurrent runs allowed (FARA_MCP_CONCURRENCY, default min(4, CPU count))."""
+    default = min(4, os.cpu_count() or 1)
+    try:
+        return max(1, int(os.environ.get("FARA_MCP_CONCURRENCY", default)))
+    except ValueError:
+        logger.warning("Ignoring invalid FARA_MCP_CONCURRENCY; using %d", default)
+        return default
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Compact JSON bytes, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json_text(obj: Any) -> str:
+    """Compact JSON text for tool responses; clients parse it, so no indent."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-str keys or big ints in task YAML; use stdlib
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _now_iso() -> str:
-    return datetime.utcnow().isoformat()
+    # Naive UTC ISO string, the format stored in existing run records.
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+_STAMP_FMT = "%Y%m%d-%H%M%S"
+_stamp_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_stamp() -> str:
+    """Compact UTC stamp used in run and task ids; formatted at most once per second."""
+    global _stamp_cache
+    now = int(time.time())
+    if _stamp_cache[0] != now:
+        _stamp_cache = (now, time.strftime(_STAMP_FMT, time.gmtime(now)))
+    return _stamp_cache[1]
 
 
 def _file_uri(path: Path | None) -> str | None:
     if not path:
         return None
+    return _resolved_uri(path)
+
+
+@lru_cache(maxsize=4096)
+def _resolved_uri(path: Path) -> str:
+    # Paths under ROOT are already absolute; relative ones still need resolve()
+    # (a stat per path component), which the cache limits to once per path.
+    if path.is_absolute():
+        return path.as_uri()
     return path.resolve().as_uri()
 
 
 def _compact_actions(result: TestRunResult, limit: int = 5) -> list[dict[str, Any]]:
-    actions = result.actions[-limit:]
+    actions = result.recent_actions(limit)
     return [
         {
             "round": a.round_index,
@@ -88,7 +150,7 @@ def _build_summary(result: TestRunResult, limit_actions: int = 5) -> dict[str, A
     }
 
 
-@dataclass
+@dataclass(slots=True)  # the index keeps every historical run in memory
 class RunRecord:
     run_id: str
     task_id: str
@@ -100,29 +162,128 @@ class RunRecord:
     report_paths: dict[str, str] | None
     partial_report: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Flat dict in field order; cheaper than a deep-copying dataclasses.asdict walk."""
+        return {
+            "run_id": self.run_id,
+            "task_id": self.task_id,
+            "status": self.status,
+            "success": self.success,
+            "reason": self.reason,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "report_paths": dict(self.report_paths) if self.report_paths is not None else None,
+            "partial_report": self.partial_report,
+        }
+
+    def report_paths_as_uris(self) -> dict[str, str | None] | None:
+        """report_paths with filesystem paths turned into file:// URIs.
+
+        Paths are stored raw so status updates skip resolve(); conversion
+        happens here, on the (rarer) read path. Values that are already URIs,
+        as written by older index files, pass through unchanged.
+        """
+        if self.report_paths is None:
+            return None
+        return {
+            kind: value if not value or value.startswith("file:") else _file_uri(Path(value))
+            for kind, value in self.report_paths.items()
+        }
+
 
 class RunIndex:
-    """Persistent run index so the agent can fetch by id or retry."""
+    """Persistent run index so the agent can fetch by id or retry.
+
+    On disk the index is a snapshot (`run_index.json`) plus an append-only
+    journal (`run_index.jsonl`) of records changed since the snapshot. Writes are
+    debounced: `put` marks the record pending and a single flush runs SAVE_DELAY
+    seconds later, appending one journal line per changed run. The journal is
+    folded back into the snapshot once it grows past the compaction limits.
+
+    Files are not fsync'd unless FARA_MCP_FSYNC=1; the index is a convenience
+    cache of run metadata, and losing the last writes on power failure is fine.
+    """
+
+    SAVE_DELAY = 0.25
+    COMPACT_LINES = 500
+    COMPACT_BYTES = 256 * 1024
 
     def __init__(self, path: Path):
         self.path = path
+        # Read here rather than at import, so a .env loaded at startup applies.
+        self.fsync = os.environ.get("FARA_MCP_FSYNC", "").lower() in ("1", "true", "yes")
+        self._journal_path = path.with_suffix(".jsonl")
         self._runs: dict[str, RunRecord] = {}
+        self._pending: dict[str, RunRecord] = {}
+        self._journal_lines = 0
+        self._save_handle: asyncio.TimerHandle | None = None
         self._load()
 
     def _load(self) -> None:
-        if not self.path.exists():
-            return
-        try:
-            raw = json.loads(self.path.read_text(encoding="utf-8"))
-            for run_id, data in raw.items():
-                self._runs[run_id] = RunRecord(**data)
-        except Exception as exc:
-            logger.warning(f"Failed to load run index: {exc}")
+        if self.path.exists():
+            try:
+                raw = _json_loads(self.path.read_bytes())
+                for run_id, data in raw.items():
+                    self._runs[run_id] = RunRecord(**data)
+            except Exception as exc:
+                logger.warning(f"Failed to load run index: {exc}")
+        if self._journal_path.exists():
+            try:
+                raw = self._journal_path.read_bytes()
+                if raw and not raw.endswith(b"\n"):
+                    # A crash mid-append left a torn last line; cut it so the
+                    # next append starts on a line of its own.
+                    raw = raw[: raw.rfind(b"\n") + 1]
+                    os.truncate(self._journal_path, len(raw))
+            except OSError as exc:
+                logger.warning(f"Failed to read run index journal: {exc}")
+                return
+            for line in raw.splitlines():
+                try:
+                    record = RunRecord(**_json_loads(line))
+                except Exception:
+                    continue
+                self._runs[record.run_id] = record
+                self._journal_lines += 1
 
     def _save(self) -> None:
-        payload = {rid: asdict(run) for rid, run in self._runs.items()}
+        """Rewrite the snapshot and drop the journal it now contains."""
+        payload = {rid: run.to_dict() for rid, run in self._runs.items()}
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        # Write-then-rename so readers never see a half-written index.
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps(payload))
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._journal_path.unlink(missing_ok=True)
+        self._journal_lines = 0
+
+    def _append_journal(self, records: Iterable[RunRecord]) -> None:
+        lines = [_json_dumps(record.to_dict()) + b"\n" for record in records]
+        self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._journal_path, "ab") as f:
+            f.write(b"".join(lines))
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+            size = f.tell()
+        self._journal_lines += len(lines)
+        if self._journal_lines >= self.COMPACT_LINES or size >= self.COMPACT_BYTES:
+            self._save()
+
+    def flush(self) -> None:
+        """Write pending changes now."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        if not self._pending:
+            return
+        pending = list(self._pending.values())
+        self._pending.clear()
+        self._append_journal(pending)
 
     def list_runs(self) -> list[RunRecord]:
         return list(self._runs.values())
@@ -132,7 +293,15 @@ class RunIndex:
 
     def put(self, record: RunRecord) -> None:
         self._runs[record.run_id] = record
-        self._save()
+        self._pending[record.run_id] = record
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to defer to.
+            self.flush()
+            return
+        if self._save_handle is None:
+            self._save_handle = loop.call_later(self.SAVE_DELAY, self.flush)
 
 
 class TaskStore:
@@ -143,8 +312,27 @@ class TaskStore:
         self.generated = generated
         self.root.mkdir(parents=True, exist_ok=True)
         self.generated.mkdir(parents=True, exist_ok=True)
+        self._cache: list[dict[str, Any]] | None = None
+        self._cache_sig: tuple | None = None
+
+    def _signature(self) -> tuple:
+        """(dir, name, mtime, size) of every task file; changes when any task does."""
+        entries = []
+        for base in (self.root, self.generated):
+            for pattern in ("*.yaml", "*.yml", "*.json"):
+                for path in base.glob(pattern):
+                    try:
+                        st = path.stat()
+                    except OSError:
+                        continue
+                    entries.append((str(base), path.name, st.st_mtime_ns, st.st_size))
+        return tuple(sorted(entries))
 
     def list_tasks(self) -> list[dict[str, Any]]:
+        sig = self._signature()
+        if self._cache is not None and sig == self._cache_sig:
+            return [dict(entry) for entry in self._cache]
+
         # Prefer generated overrides if IDs collide.
         merged: dict[str, tuple[TestCase, str]] = {}
         for case, source in [
@@ -153,7 +341,7 @@ class TaskStore:
         ]:
             merged[case.id] = (case, source)
 
-        return [
+        tasks = [
             {
                 "id": case.id,
                 "objective": case.objective,
@@ -164,6 +352,9 @@ class TaskStore:
             }
             for case, source in merged.values()
         ]
+        self._cache = tasks
+        self._cache_sig = sig
+        return [dict(entry) for entry in tasks]
 
     def load(self, task_id: str) -> TestCase:
         for base in (self.generated, self.root):
@@ -179,7 +370,7 @@ class TaskStore:
                 f"Invalid task payload: {'; '.join(errors)}",
                 task_id=str(task.get("id") or task.get("name") or ""),
             )
-        task_id = str(task.get("id") or task.get("name") or f"task-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}")
+        task_id = str(task.get("id") or task.get("name") or f"task-{_utc_stamp()}")
         path = self.root / f"{task_id}.yaml"
         if path.exists():
             raise FileExistsError(f"Task already exists: {task_id}")
@@ -190,10 +381,108 @@ class TaskStore:
         # Persist as YAML to stay compatible
         import yaml
 
-        path.write_text(yaml.safe_dump(task), encoding="utf-8")
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        path.write_text(yaml.dump(task, Dumper=dumper), encoding="utf-8")
+        self._cache_sig = None
         return task_id
 
 
+# The tool surface is fixed, so the Tool objects are built once at import.
+_TOOLS: list[types.Tool] = [
+    types.Tool(
+        name="list_tasks",
+        description="List available E2E tasks",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    types.Tool(
+        name="create_task",
+        description=(
+            "Create a new natural-language E2E task. Always include the structured fields below and an ordered "
+            "step-by-step guide for the objective so the agent can navigate without looping."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {"type": "string", "description": "Task id/filename (defaults to autogenerated timestamp id)"},
+                "objective": {"type": "string", "description": "Single-sentence goal of the test"},
+                "objective_steps": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Ordered, concrete steps (3-10) the agent should follow to reach the objective",
+                },
+                "pass_criteria": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Conditions that must be true to count as PASS",
+                },
+                "fail_criteria": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Conditions that indicate FAILURE/blockers",
+                },
+                "start_url": {"type": "string", "description": "Optional starting URL for the flow"},
+                "credentials": {
+                    "type": "object",
+                    "description": "Optional key/value secrets needed to log in or submit forms",
+                },
+                "notes": {"type": "string", "description": "Extra context to reduce ambiguity"},
+                "tags": {"type": "array", "items": {"type": "string"}, "description": "Tags for selection (e.g., smoke, auth, p0)"},
+                "priority": {"type": "integer", "description": "1-10 (1=highest); used for ordering"},
+                "retry_count": {"type": "integer", "description": "Number of times to retry on failure"},
+                "max_rounds": {"type": "integer", "description": "Max model action rounds before aborting"},
+                "timeout_seconds": {"type": "number", "description": "Overall timeout for the task"},
+                "owner": {"type": "string", "description": "Owner/team for the test"},
+                "skip": {"type": "boolean", "description": "Mark true to skip the task"},
+                "skip_reason": {"type": "string", "description": "Why the task is skipped"},
+            },
+            "required": ["objective", "objective_steps", "pass_criteria", "fail_criteria"],
+            "additionalProperties": True,
+        },
+    ),
+    types.Tool(
+        name="run_task",
+        description="Run a task by id",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_id": {"type": "string"},
+                "headful_debug": {"type": "boolean"},
+                "retries": {"type": "integer"},
+                "output_format": {"type": "string", "enum": ["json", "html", "all"]},
+                "max_actions": {"type": "integer"},
+                "embed_screenshots": {"type": "boolean"},
+            },
+            "required": ["task_id"],
+        },
+    ),
+    types.Tool(
+        name="list_runs",
+        description="List recent runs",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    types.Tool(
+        name="get_run_status",
+        description="Get compact status for a run_id",
+        inputSchema={"type": "object", "properties": {"run_id": {"type": "string"}}, "required": ["run_id"]},
+    ),
+    types.Tool(
+        name="get_report",
+        description="Fetch report paths and details for a run_id",
+        inputSchema={"type": "object", "properties": {"run_id": {"type": "string"}}, "required": ["run_id"]},
+    ),
+    types.Tool(
+        name="retry_run",
+        description="Retry the task from a previous run_id",
+        inputSchema={"type": "object", "properties": {"run_id": {"type": "string"}}, "required": ["run_id"]},
+    ),
+    types.Tool(
+        name="cancel_run",
+        description="Attempt to cancel an in-progress run",
+        inputSchema={"type": "object", "properties": {"run_id": {"type": "string"}}, "required": ["run_id"]},
+    ),
+]
+
+
 class E2EMCPServer:
     """Glue layer between MCP and the E2E runner."""
 
@@ -202,131 +491,73 @@ class E2EMCPServer:
         self.task_store = TaskStore(TASKS_DIR, GENERATED_TASKS_DIR)
         self.run_index = RunIndex(RUN_INDEX_PATH)
         self._active_tasks: dict[str, asyncio.Task] = {}
-        self._semaphore = asyncio.Semaphore(1)  # limit concurrent Playwright runs
+        self._concurrency = _run_concurrency()
+        self._semaphore = asyncio.Semaphore(self._concurrency)  # limit concurrent Playwright runs
+        # Warm browsers shared by runs, one pool per (engine, headless); each run
+        # still gets its own BrowserContext.
+        self._browser_pools: dict[tuple[str, bool], Any] = {}
+        self._pool_lock = asyncio.Lock()
+        self._init_options: InitializationOptions | None = None
         self._register_handlers()
 
+    async def _get_browser_pool(self, browser_type: str, headless: bool) -> Any:
+        from browser import BrowserPool
+
+        key = (browser_type, headless)
+        async with self._pool_lock:
+            pool = self._browser_pools.get(key)
+            if pool is None:
+                pool = BrowserPool(
+                    browser_type=browser_type,
+                    headless=headless,
+                    max_concurrency=self._concurrency,
+                    logger=logger,
+                )
+                self._browser_pools[key] = pool
+            return pool
+
+    async def close(self) -> None:
+        """Close shared browser pools and write any pending run index changes."""
+        pools = list(self._browser_pools.values())
+        self._browser_pools.clear()
+        for pool in pools:
+            try:
+                await pool.close()
+            except Exception:
+                logger.exception("Failed to close browser pool")
+        self.run_index.flush()
+
     def _register_handlers(self) -> None:
+        # Tool name -> handler(arguments); coroutine results are awaited.
+        dispatch: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "list_tasks": lambda args: self.task_store.list_tasks(),
+            "create_task": self._create_task,
+            "run_task": self._run_task,
+            "list_runs": lambda args: [self._run_payload(r) for r in self.run_index.list_runs()],
+            "get_run_status": lambda args: self._get_run(args.get("run_id")),
+            "get_report": lambda args: self._get_run(args.get("run_id"), include_paths=True),
+            "retry_run": lambda args: self._retry_run(args.get("run_id")),
+            "cancel_run": lambda args: self._cancel_run(args.get("run_id")),
+        }
+
         @self.server.list_tools()
         async def list_tools() -> list[types.Tool]:
-            return [
-                types.Tool(
-                    name="list_tasks",
-                    description="List available E2E tasks",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                types.Tool(
-                    name="create_task",
-                    description=(
-                        "Create a new natural-language E2E task. Always include the structured fields below and an ordered "
-                        "step-by-step guide for the objective so the agent can navigate without looping."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string", "description": "Task id/filename (defaults to autogenerated timestamp id)"},
-                            "objective": {"type": "string", "description": "Single-sentence goal of the test"},
-                            "objective_steps": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Ordered, concrete steps (3-10) the agent should follow to reach the objective",
-                            },
-                            "pass_criteria": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Conditions that must be true to count as PASS",
-                            },
-                            "fail_criteria": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Conditions that indicate FAILURE/blockers",
-                            },
-                            "start_url": {"type": "string", "description": "Optional starting URL for the flow"},
-                            "credentials": {
-                                "type": "object",
-                                "description": "Optional key/value secrets needed to log in or submit forms",
-                            },
-                            "notes": {"type": "string", "description": "Extra context to reduce ambiguity"},
-                            "tags": {"type": "array", "items": {"type": "string"}, "description": "Tags for selection (e.g., smoke, auth, p0)"},
-                            "priority": {"type": "integer", "description": "1-10 (1=highest); used for ordering"},
-                            "retry_count": {"type": "integer", "description": "Number of times to retry on failure"},
-                            "max_rounds": {"type": "integer", "description": "Max model action rounds before aborting"},
-                            "timeout_seconds": {"type": "number", "description": "Overall timeout for the task"},
-                            "owner": {"type": "string", "description": "Owner/team for the test"},
-                            "skip": {"type": "boolean", "description": "Mark true to skip the task"},
-                            "skip_reason": {"type": "string", "description": "Why the task is skipped"},
-                        },
-                        "required": ["objective", "objective_steps", "pass_criteria", "fail_criteria"],
-                        "additionalProperties": True,
-                    },
-                ),
-                types.Tool(
-                    name="run_task",
-                    description="Run a task by id",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "task_id": {"type": "string"},
-                            "headful_debug": {"type": "boolean"},
-                            "retries": {"type": "integer"},
-                            "output_format": {"type": "string", "enum": ["json", "html", "all"]},
-                            "max_actions": {"type": "integer"},
-                        },
-                        "required": ["task_id"],
-                    },
-                ),
-                types.Tool(
-                    name="list_runs",
-                    description="List recent runs",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                types.Tool(
-                    name="get_run_status",
-                    description="Get compact status for a run_id",
-                    inputSchema={"type": "object", "properties": {"run_id": {"type": "string"}}, "required": ["run_id"]},
-                ),
-                types.Tool(
-                    name="get_report",
-                    description="Fetch report paths and details for a run_id",
-                    inputSchema={"type": "object", "properties": {"run_id": {"type": "string"}}, "required": ["run_id"]},
-                ),
-                types.Tool(
-                    name="retry_run",
-                    description="Retry the task from a previous run_id",
-                    inputSchema={"type": "object", "properties": {"run_id": {"type": "string"}}, "required": ["run_id"]},
-                ),
-                types.Tool(
-                    name="cancel_run",
-                    description="Attempt to cancel an in-progress run",
-                    inputSchema={"type": "object", "properties": {"run_id": {"type": "string"}}, "required": ["run_id"]},
-                ),
-            ]
+            return _TOOLS
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
             def _wrap(payload: dict[str, Any]) -> list[types.TextContent]:
-                return [types.TextContent(type="text", text=json.dumps(payload, indent=2))]
+                return [types.TextContent(type="text", text=_json_text(payload))]
 
             logger.info("call_tool start: %s args=%s", name, arguments)
             try:
-                if name == "list_tasks":
-                    payload = self.task_store.list_tasks()
-                elif name == "create_task":
-                    task_id = self.task_store.create(arguments)
-                    payload = {"task_id": task_id, "status": "created"}
-                elif name == "run_task":
-                    payload = await self._run_task(arguments)
-                elif name == "list_runs":
-                    payload = [asdict(r) for r in self.run_index.list_runs()]
-                elif name == "get_run_status":
-                    payload = self._get_run(arguments.get("run_id"))
-                elif name == "get_report":
-                    payload = self._get_run(arguments.get("run_id"), include_paths=True)
-                elif name == "retry_run":
-                    payload = await self._retry_run(arguments.get("run_id"))
-                elif name == "cancel_run":
-                    payload = await self._cancel_run(arguments.get("run_id"))
-                else:
+                handler = dispatch.get(name)
+                if handler is None:
                     payload = {"error": f"Unknown tool: {name}"}
+                else:
+                    payload = handler(arguments)
+                    if inspect.isawaitable(payload):
+                        payload = await payload
             except Exception as exc:
                 logger.exception("Tool call failed: %s", name)
                 payload = {"error": str(exc), "tool": name}
@@ -334,14 +565,24 @@ class E2EMCPServer:
             logger.info("call_tool done: %s", name)
             return _wrap(payload)
 
+    def _create_task(self, args: dict[str, Any]) -> dict[str, Any]:
+        task_id = self.task_store.create(args)
+        return {"task_id": task_id, "status": "created"}
+
     def _get_run(self, run_id: Optional[str], include_paths: bool = False) -> dict[str, Any]:
         if not run_id:
             raise ValueError("run_id is required")
         record = self.run_index.get(run_id)
         if not record:
             raise FileNotFoundError(f"Run not found: {run_id}")
-        data = asdict(record)
-        if not include_paths:
+        return self._run_payload(record, include_paths=include_paths)
+
+    @staticmethod
+    def _run_payload(record: RunRecord, include_paths: bool = True) -> dict[str, Any]:
+        data = record.to_dict()
+        if include_paths:
+            data["report_paths"] = record.report_paths_as_uris()
+        else:
             data.pop("report_paths", None)
         return data
 
@@ -357,7 +598,8 @@ class E2EMCPServer:
             case.retry_count = max(0, int(retries))
 
         logger.info("run_task enqueue: %s", task_id)
-        run_id = f"{task_id}-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}"
+        # Runs execute concurrently; the suffix keeps same-second runs of one task apart.
+        run_id = f"{task_id}-{_utc_stamp()}-{uuid.uuid4().hex[:6]}"
         partial_path = REPORTS_DIR / f"{run_id}-partial.json"
         record = RunRecord(
             run_id=run_id,
@@ -383,16 +625,27 @@ class E2EMCPServer:
             config.reporting.reports_folder = REPORTS_DIR
             config.reporting.screenshots_folder = SCREENSHOTS_DIR
             config.reporting.output_format = output_format
+            embed_screenshots = bool(
+                args.get("embed_screenshots", config.reporting.embed_screenshots)
+            )
 
             try:
-                runner = E2ETestRunner(config=config, logger=logger)
-                result = await runner.run_task_with_retries(case, trace_path=partial_path)
+                from reporters import JSONReporter
+                from test_runner import E2ETestRunner
+
+                pool = await self._get_browser_pool(config.browser.browser, config.browser.headless)
+                runner = E2ETestRunner(config=config, logger=logger, browser_pool=pool)
+                result = await runner.run_task_with_retries(
+                    case, trace_path=partial_path, run_id=run_id
+                )
 
                 reporter = JSONReporter()
                 json_path = reporter.generate(result, REPORTS_DIR)
                 html_path = None
                 if output_format in ("html", "all"):
-                    html_path = HTMLReporter(embed_screenshots=config.reporting.embed_screenshots).generate(
+                    from reporters import HTMLReporter
+
+                    html_path = HTMLReporter(embed_screenshots=embed_screenshots).generate(
                         result, REPORTS_DIR
                     )
 
@@ -401,8 +654,8 @@ class E2EMCPServer:
                 record.reason = result.reason
                 record.finished_at = _now_iso()
                 record.report_paths = {
-                    "json": _file_uri(json_path),
-                    "html": _file_uri(html_path) if html_path else None,
+                    "json": str(json_path),
+                    "html": str(html_path) if html_path else None,
                 }
                 self.run_index.put(record)
             except Exception as exc:
@@ -413,6 +666,8 @@ class E2EMCPServer:
                 record.finished_at = _now_iso()
                 self.run_index.put(record)
             finally:
+                # Terminal state should hit disk without waiting for the debounce.
+                self.run_index.flush()
                 logger.info("run_task worker finished: %s", task_id)
 
         async def wrapped_worker():
@@ -467,27 +722,45 @@ class E2EMCPServer:
         self.run_index.put(record)
         return {"run_id": run_id, "status": "cancelled"}
 
+    def initialization_options(self) -> InitializationOptions:
+        """Capabilities are fixed for the process, so build the options once."""
+        if self._init_options is None:
+            self._init_options = InitializationOptions(
+                server_name="fara-e2e-mcp",
+                server_version="0.1.0",
+                capabilities=self.server.get_capabilities(
+                    notification_options=self.server.notification_options,
+                    experimental_capabilities={},
+                ),
+                instructions=self.server.instructions,
+            )
+        return self._init_options
+
     async def serve(self) -> None:
-        init_opts = InitializationOptions(
-            server_name="fara-e2e-mcp",
-            server_version="0.1.0",
-            capabilities=self.server.get_capabilities(
-                notification_options=self.server.notification_options,
-                experimental_capabilities={},
-            ),
-            instructions=self.server.instructions,
-        )
         async with stdio_server() as (read_stream, write_stream):
             await self.server.run(
                 read_stream,
                 write_stream,
-                initialization_options=init_opts,
+                initialization_options=self.initialization_options(),
             )
 
 
+def _event_loop_options() -> dict[str, Any]:
+    """anyio asyncio-backend options; uses uvloop when it's installed (not on Windows)."""
+    if sys.platform == "win32":
+        return {}
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return {}
+    return {"use_uvloop": True}
+
+
 def main() -> None:
     import argparse
 
+    from dotenv import load_dotenv
+
     parser = argparse.ArgumentParser(description="Fara MCP server (stdio or HTTP SSE)")
     parser.add_argument("--http", help="Run HTTP SSE server on host:port (e.g., 127.0.0.1:8765)")
     args = parser.parse_args()
@@ -505,44 +778,38 @@ def main() -> None:
     except Exception:
         logger.exception("Failed to set up file logging")
 
+    # FARA_MCP_* settings are read while the server is built, before any config load.
+    load_dotenv()
     srv = E2EMCPServer()
 
     async def run_stdio():
-        init_opts = InitializationOptions(
-            server_name="fara-e2e-mcp",
-            server_version="0.1.0",
-            capabilities=srv.server.get_capabilities(
-                notification_options=srv.server.notification_options,
-                experimental_capabilities={},
-            ),
-            instructions=srv.server.instructions,
-        )
-        async with stdio_server() as (read_stream, write_stream):
-            await srv.server.run(
-                read_stream,
-                write_stream,
-                initialization_options=init_opts,
-            )
+        init_opts = srv.initialization_options()
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await srv.server.run(
+                    read_stream,
+                    write_stream,
+                    initialization_options=init_opts,
+                )
+        finally:
+            await srv.close()
 
     async def run_http(bind: str):
+        import uvicorn
+        from mcp.server.sse import SseServerTransport
+        from starlette.applications import Starlette
+        from starlette.responses import Response
+        from starlette.routing import Route
+
         host, port = bind.split(":")
         transport = SseServerTransport("/messages")
 
         async def handle_sse(request):
             async with transport.connect_sse(request.scope, request.receive, request._send) as streams:
-                init_opts = InitializationOptions(
-                    server_name="fara-e2e-mcp",
-                    server_version="0.1.0",
-                    capabilities=srv.server.get_capabilities(
-                        notification_options=srv.server.notification_options,
-                        experimental_capabilities={},
-                    ),
-                    instructions=srv.server.instructions,
-                )
                 await srv.server.run(
                     streams[0],
                     streams[1],
-                    initialization_options=init_opts,
+                    initialization_options=srv.initialization_options(),
                     stateless=True,
                 )
             return Response()
@@ -570,18 +837,28 @@ def main() -> None:
 
         app = Starlette(routes=routes)
         logger.info("HTTP SSE server listening on http://%s:%s", host, port)
-        config = uvicorn.Config(app, host=host, port=int(port), log_level="info")
+        # Under anyio.run the loop already exists (uvloop when installed), and
+        # uvicorn's http="auto" picks httptools when it's available. Per-request
+        # access lines would mostly be get_run_status polls.
+        config = uvicorn.Config(app, host=host, port=int(port), log_level="info", access_log=False)
         server = uvicorn.Server(config)
-        await server.serve()
+        try:
+            await server.serve()
+        finally:
+            await srv.close()
 
+    backend_options = _event_loop_options()
     try:
         if args.http:
-            anyio.run(run_http, args.http)
+            anyio.run(run_http, args.http, backend_options=backend_options)
         else:
-            anyio.run(run_stdio)
+            anyio.run(run_stdio, backend_options=backend_options)
     except Exception:
         logger.exception("MCP server crashed")
         raise
+    finally:
+        # Normally done by srv.close(); covers a crash before the server started.
+        srv.run_index.flush()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """System prompts for the Fara agent"""
 import math
+from functools import lru_cache
 
 IMAGE_FACTOR = 28
 MIN_PIXELS = 4 * 28 * 28
@@ -22,6 +23,7 @@ def floor_by_factor(number: int, factor: int) -> int:
     return math.floor(number / factor) * factor
 
 
+@lru_cache(maxsize=256)
 def smart_resize(
     height: int,
     width: int,
@@ -52,32 +54,11 @@ def smart_resize(
     return h_bar, w_bar
 
 
-def get_computer_use_system_prompt(
-    image,
-    processor_im_cfg,
-    include_input_text_key_args: bool = True,
-):
-    """Generate the system prompt with tool description"""
-    patch_size = processor_im_cfg["patch_size"]
-    merge_size = processor_im_cfg["merge_size"]
-    min_pixels = processor_im_cfg["min_pixels"]
-    max_pixels = processor_im_cfg["max_pixels"]
-
-    resized_height, resized_width = smart_resize(
-        image.height,
-        image.width,
-        factor=patch_size * merge_size,
-        min_pixels=min_pixels,
-        max_pixels=max_pixels,
-    )
-
-    text_key_args = ""
-    if include_input_text_key_args:
-        text_key_args = """
+_TEXT_KEY_ARGS = """
 - Optional typing args: set `press_enter` true|false to control submission, and `delete_existing_text` to clear existing input before typing.
 """
 
-    system_prompt = f"""You are a meticulous QA E2E tester operating a real browser.
+_SYSTEM_PROMPT_TEMPLATE = """You are a meticulous QA E2E tester operating a real browser.
 
 The screen's resolution is {resized_width}x{resized_height} pixels.
 
@@ -138,7 +119,51 @@ Examples:
 {{"name": "computer_use", "arguments": {{"action": "terminate", "status": "success", "reason": "Redirected to dashboard after signup."}}}}
 </tool_call>"""
 
+
+@lru_cache(maxsize=32)
+def _build_system_prompt(
+    height: int,
+    width: int,
+    patch_size: int,
+    merge_size: int,
+    min_pixels: int,
+    max_pixels: int,
+    include_input_text_key_args: bool,
+) -> tuple[str, tuple[int, int]]:
+    resized_height, resized_width = smart_resize(
+        height,
+        width,
+        factor=patch_size * merge_size,
+        min_pixels=min_pixels,
+        max_pixels=max_pixels,
+    )
+    content = _SYSTEM_PROMPT_TEMPLATE.format_map(
+        {
+            "resized_width": resized_width,
+            "resized_height": resized_height,
+            "text_key_args": _TEXT_KEY_ARGS if include_input_text_key_args else "",
+        }
+    )
+    return content, (resized_width, resized_height)
+
+
+def get_computer_use_system_prompt(
+    image,
+    processor_im_cfg,
+    include_input_text_key_args: bool = True,
+):
+    """Generate the system prompt with tool description"""
+    content, im_size = _build_system_prompt(
+        image.height,
+        image.width,
+        processor_im_cfg["patch_size"],
+        processor_im_cfg["merge_size"],
+        processor_im_cfg["min_pixels"],
+        processor_im_cfg["max_pixels"],
+        include_input_text_key_args,
+    )
+    # Fresh dict per call; only the string and size tuple are shared.
     return {
-        "content": system_prompt,
-        "im_size": (resized_width, resized_height),
+        "content": content,
+        "im_size": im_size,
     }
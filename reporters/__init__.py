@@ -1,8 +1,15 @@
 """Report generators for E2E test runs."""
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from reporters.base import BaseReporter, ReportFormat
-from reporters.html import HTMLReporter
-from reporters.json_reporter import JSONReporter
-from reporters.junit import JUnitReporter
+
+if TYPE_CHECKING:
+    from reporters.html import HTMLReporter
+    from reporters.json_reporter import JSONReporter
+    from reporters.junit import JUnitReporter
 
 __all__ = [
     "BaseReporter",
@@ -12,3 +19,19 @@ __all__ = [
     "JUnitReporter",
 ]
 
+# Reporters are imported on first use, so picking one format doesn't load the others.
+_LAZY_REPORTERS = {
+    "HTMLReporter": "reporters.html",
+    "JSONReporter": "reporters.json_reporter",
+    "JUnitReporter": "reporters.junit",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve reporter classes lazily (PEP 562)."""
+    module_name = _LAZY_REPORTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
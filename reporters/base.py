@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import List
@@ -48,6 +49,13 @@ class BaseReporter(ABC):
         """
         pass
 
+    @staticmethod
+    def _report_stem(result: TestRunResult) -> str:
+        """File name stem for a single-result report; the run id keeps concurrent runs apart."""
+        if result.run_id:
+            return result.run_id
+        return f"{result.case.id}-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}"
+
     @property
     @abstractmethod
     def format(self) -> ReportFormat:
@@ -1,16 +1,161 @@
 """Enhanced HTML report generator for E2E test runs."""
 from __future__ import annotations
 
-import base64
 import html
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from reporters.base import BaseReporter, ReportFormat
 from test_types import ActionTrace, TestRunResult
 
+try:  # optional: SIMD base64 for embedded screenshots
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
+
+# Threads used by generate_suite to write per-case reports.
+_SUITE_WORKERS = 8
+
+# Stylesheet/script files written next to suite reports.
+CSS_ASSET = "report.css"
+JS_ASSET = "report.js"
+
+_NEEDS_ESCAPE = re.compile(r"[&<>\"']").search
+
+
+def _esc(text: str) -> str:
+    """html.escape, skipped for the common case of text with nothing to escape."""
+    return html.escape(text) if _NEEDS_ESCAPE(text) else text
+
+
+# Only short arguments reprs go through the cache; long ones rarely repeat.
+_CACHED_ARGS_MAX = 256
+
+
+@lru_cache(maxsize=8192)
+def _esc_cached(text: str) -> str:
+    """_esc for low-cardinality fields (action names, URLs, short argument reprs)
+    that repeat across rows and between the timeline and the table."""
+    return _esc(text)
+
+
+def _esc_args(arguments: object) -> str:
+    text = str(arguments)
+    return _esc_cached(text) if len(text) <= _CACHED_ARGS_MAX else _esc(text)
+
+
+@lru_cache(maxsize=1024)
+def _relpath(path: str, root: str) -> str:
+    return os.path.relpath(path, start=root)
+
+
+# (round, status class, action, url, args, result, timeline model preview,
+# table model snippet, screenshot src); text fields are already HTML-escaped.
+_Row = Tuple[int, str, str, str, str, str, str, str, str]
+
+def _minify_css(css: str) -> str:
+    """Drop comments and collapse whitespace in the report stylesheet."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};,])\s*", r"\1", css).strip()
+
+
+def _minify_js(js: str) -> str:
+    """Strip indentation, blank lines and whole-line // comments; newlines stay
+    so ASI still applies."""
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def _is_success(text: str) -> bool:
+    """Whether ``text`` mentions success, in any letter case."""
+    return "success" in text.casefold()
+
+
+def _latest_suite_report(output_dir: Path) -> Optional[str]:
+    """Name of the most recently modified suite-*.html in ``output_dir``, if any."""
+    latest, latest_mtime = None, -1.0
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("suite-") and name.endswith(".html"):
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest, latest_mtime = name, mtime
+    return latest
+
+
+# Empty-state icons, defined once per page and referenced with <use>.
+_EMPTY_ICONS_SPRITE = (
+    '<svg style="display:none"><defs>'
+    '<symbol id="icon-empty-timeline" viewBox="0 0 24 24">'
+    '<g fill="none" stroke="currentColor" stroke-width="2">'
+    '<circle cx="12" cy="12" r="10"/><line x1="12" y1="8" x2="12" y2="12"/>'
+    '<line x1="12" y1="16" x2="12.01" y2="16"/></g></symbol>'
+    '<symbol id="icon-empty-table" viewBox="0 0 24 24">'
+    '<g fill="none" stroke="currentColor" stroke-width="2">'
+    '<rect x="3" y="3" width="18" height="18" rx="2" ry="2"/><line x1="9" y1="9" x2="15" y2="9"/>'
+    '<line x1="9" y1="15" x2="15" y2="15"/></g></symbol>'
+    "</defs></svg>"
+)
+
+# Per-action row markup, parsed once; rendered with str.format_map.
+_TIMELINE_ROW_TMPL = '''
+            <div class="timeline-item {status}" data-round="{round}">
+                <div class="timeline-marker">
+                    <span class="round-num">{round}</span>
+                </div>
+                <div class="timeline-content">
+                    <div class="timeline-header">
+                        <span class="action-name">{action}</span>
+                        <span class="action-url">{url}</span>
+                    </div>
+                    <div class="timeline-body">
+                        <div class="action-args"><code>{args}</code></div>
+                        <div class="action-result">{result}</div>
+                        <details class="model-response">
+                            <summary>Model Response</summary>
+                            <pre>{model}</pre>
+                        </details>
+                    </div>
+                    {screenshot}
+                </div>
+            </div>'''
+
+_TABLE_ROW_TMPL = """
+            <tr data-action="{action}">
+                <td>{round}</td>
+                <td><span class="action-badge">{action}</span></td>
+                <td><code class="url">{url}</code></td>
+                <td><code class="args">{args}</code></td>
+                <td class="result">{result}</td>
+                <td class="model-col">{model}</td>
+                <td class="screenshot-col">{screenshot}</td>
+            </tr>"""
+
+# Suite page card per test result, rendered the same way.
+_SUITE_CARD_TMPL = '''
+            <div class="test-card {verdict_class}">
+                <div class="test-header">
+                    <a href="{link}" class="test-name-link">
+                        <span class="test-name">{case_id}</span>
+                    </a>
+                    <span class="badge {verdict_class}">{verdict_text}</span>
+                </div>
+                <p class="test-objective">{objective}</p>
+                <div class="test-meta">
+                    <span>Duration: {duration:.1f}s</span>
+                    <span>Actions: {actions}</span>
+                </div>
+                <p class="test-reason">{reason}</p>
+                <a href="{link}" class="view-details">View Details →</a>
+            </div>'''
+
 
 class HTMLReporter(BaseReporter):
     """Generate enhanced HTML reports with embedded screenshots and timeline."""
@@ -32,27 +177,60 @@ class HTMLReporter(BaseReporter):
         """Render a list of items as HTML."""
         if not items:
             return "<p class='empty'>None</p>"
-        inner = "".join(f"<li>{html.escape(item)}</li>" for item in items)
+        inner = "".join(f"<li>{_esc(item)}</li>" for item in items)
         return f"<ul>{inner}</ul>"
 
-    def _get_screenshot_src(self, screenshot_path: Optional[Path], report_root: Path) -> str:
-        """Get screenshot source - either base64 or relative path."""
-        if not screenshot_path:
-            return ""
-        
-        path = Path(screenshot_path)
-        if not path.exists():
-            return ""
-        
+    def _get_screenshot_src(self, screenshot_path: str, report_root: str) -> str:
+        """Get screenshot source - either base64 or relative path.
+
+        ``report_root`` must already be absolute (see ``_screenshot_srcs``).
+        """
         if self.embed_screenshots:
             try:
-                with open(path, "rb") as f:
-                    data = base64.b64encode(f.read()).decode("utf-8")
+                with open(screenshot_path, "rb") as f:
+                    data = _b64encode(f.read()).decode("ascii")
                 return f"data:image/png;base64,{data}"
+            except FileNotFoundError:
+                return ""
             except Exception:
                 pass
-        
-        return os.path.relpath(path, start=report_root)
+        elif not os.path.exists(screenshot_path):
+            return ""
+
+        return _relpath(screenshot_path, report_root)
+
+    def _pack_actions(self, actions: Iterable[ActionTrace], report_root: Path) -> List[_Row]:
+        """Flatten actions into row tuples shared by the timeline and the table.
+
+        Escaping, the status class and screenshot sources are computed once per
+        action (screenshots once per distinct path) instead of once per view.
+        """
+        root = os.path.abspath(report_root)
+        srcs: Dict[Path, str] = {}
+        rows: List[_Row] = []
+        for act in actions:
+            action, result, shot = act.action, act.result, act.screenshot_path
+            model_response = act.model_response
+            status_class = "success" if action != "auto_terminate" or _is_success(result) else "failure"
+            if action == "terminate":
+                status_class = "success" if _is_success(act.arguments.get("status", "")) else "failure"
+            src = ""
+            if shot:
+                src = srcs.get(shot)
+                if src is None:
+                    src = srcs[shot] = self._get_screenshot_src(os.fspath(shot), root)
+            rows.append((
+                act.round_index,
+                status_class,
+                _esc_cached(action),
+                _esc_cached(act.page_url),
+                _esc_args(act.arguments),
+                _esc(result),
+                _esc(model_response[:300]) + ("..." if len(model_response) > 300 else ""),
+                _esc(model_response[:400]),
+                src,
+            ))
+        return rows
 
     def _render_result_message(self, result: TestRunResult) -> str:
         """Render the result message with appropriate styling."""
@@ -60,112 +238,59 @@ class HTMLReporter(BaseReporter):
             return f"""
             <div class="meta" style="margin-top: 10px;">
                 <div class="pill" style="grid-column: 1 / -1; background: rgba(15, 81, 50, 0.3); border-color: var(--success-border);">
-                    <strong>✓ Result:</strong> {html.escape(result.reason)}
+                    <strong>✓ Result:</strong> {_esc(result.reason)}
                 </div>
             </div>"""
         else:
             return f"""
             <div style="margin-top: 12px;">
                 <div class="error-label">⚠ Error Details</div>
-                <div class="error-details">{html.escape(result.reason)}</div>
+                <div class="error-details">{_esc(result.reason)}</div>
             </div>"""
 
-    def _render_timeline(self, actions: List[ActionTrace], report_root: Path) -> str:
-        """Render an interactive timeline of actions."""
-        if not actions:
-            return """<div class='empty-state'>
-                <svg width="64" height="64" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                    <circle cx="12" cy="12" r="10"></circle>
-                    <line x1="12" y1="8" x2="12" y2="12"></line>
-                    <line x1="12" y1="16" x2="12.01" y2="16"></line>
-                </svg>
+    def _iter_timeline(self, rows: List[_Row]) -> Iterator[str]:
+        """Render an interactive timeline of actions, one chunk per row."""
+        if not rows:
+            yield """<div class='empty-state'>
+                <svg width="64" height="64"><use href="#icon-empty-timeline"/></svg>
                 <p>No actions were recorded during this test run.</p>
                 <p class='empty-hint'>This usually means the test failed before any actions could be executed.</p>
             </div>"""
+            return
 
-        items = []
-        for act in actions:
-            status_class = "success" if act.action != "auto_terminate" or "success" in act.result.lower() else "failure"
-            if act.action == "terminate":
-                status_class = "success" if "success" in act.arguments.get("status", "").lower() else "failure"
-            
+        render_row = _TIMELINE_ROW_TMPL.format_map
+        yield '<div class="timeline">'
+        for round_index, status_class, action, url, args, result, model_preview, _snippet, src in rows:
             screenshot_html = ""
-            if act.screenshot_path:
-                src = self._get_screenshot_src(act.screenshot_path, report_root)
-                if src:
-                    screenshot_html = f'''
+            if src:
+                screenshot_html = f'''
                     <div class="screenshot-preview">
-                        <img src="{src}" alt="Step {act.round_index}" loading="lazy" 
-                             onclick="openModal(this.src)" />
+                        <img src="{src}" alt="Step {round_index}" loading="lazy" />
                     </div>'''
             
-            # Parse model response for display
-            model_preview = act.model_response[:300].replace("<", "&lt;").replace(">", "&gt;")
-            if len(act.model_response) > 300:
-                model_preview += "..."
-            
-            args_str = html.escape(str(act.arguments))
-            
-            items.append(f'''
-            <div class="timeline-item {status_class}" data-round="{act.round_index}">
-                <div class="timeline-marker">
-                    <span class="round-num">{act.round_index}</span>
-                </div>
-                <div class="timeline-content">
-                    <div class="timeline-header">
-                        <span class="action-name">{html.escape(act.action)}</span>
-                        <span class="action-url">{html.escape(act.page_url)}</span>
-                    </div>
-                    <div class="timeline-body">
-                        <div class="action-args"><code>{args_str}</code></div>
-                        <div class="action-result">{html.escape(act.result)}</div>
-                        <details class="model-response">
-                            <summary>Model Response</summary>
-                            <pre>{model_preview}</pre>
-                        </details>
-                    </div>
-                    {screenshot_html}
-                </div>
-            </div>''')
-
-        return f'<div class="timeline">{"".join(items)}</div>'
-
-    def _render_actions_table(self, actions: List[ActionTrace], report_root: Path) -> str:
-        """Render actions as a filterable table."""
-        if not actions:
-            return """<div class='empty-state'>
-                <svg width="64" height="64" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                    <rect x="3" y="3" width="18" height="18" rx="2" ry="2"></rect>
-                    <line x1="9" y1="9" x2="15" y2="9"></line>
-                    <line x1="9" y1="15" x2="15" y2="15"></line>
-                </svg>
+            yield render_row({
+                "status": status_class,
+                "round": round_index,
+                "action": action,
+                "url": url,
+                "args": args,
+                "result": result,
+                "model": model_preview,
+                "screenshot": screenshot_html,
+            })
+        yield "</div>"
+
+    def _iter_actions_table(self, rows: List[_Row]) -> Iterator[str]:
+        """Render actions as a filterable table, one chunk per row."""
+        if not rows:
+            yield """<div class='empty-state'>
+                <svg width="64" height="64"><use href="#icon-empty-table"/></svg>
                 <p>No actions were recorded during this test run.</p>
                 <p class='empty-hint'>Check the error message above for details on what went wrong.</p>
             </div>"""
+            return
 
-        rows = []
-        for act in actions:
-            screenshot_cell = "—"
-            if act.screenshot_path:
-                src = self._get_screenshot_src(act.screenshot_path, report_root)
-                if src:
-                    if self.embed_screenshots:
-                        screenshot_cell = f'<img src="{src}" class="thumb" onclick="openModal(this.src)" />'
-                    else:
-                        screenshot_cell = f'<a href="{src}" target="_blank">view</a>'
-
-            rows.append(f"""
-            <tr data-action="{html.escape(act.action)}">
-                <td>{act.round_index}</td>
-                <td><span class="action-badge">{html.escape(act.action)}</span></td>
-                <td><code class="url">{html.escape(act.page_url)}</code></td>
-                <td><code class="args">{html.escape(str(act.arguments))}</code></td>
-                <td class="result">{html.escape(act.result)}</td>
-                <td class="model-col">{html.escape(act.model_response[:400])}</td>
-                <td class="screenshot-col">{screenshot_cell}</td>
-            </tr>""")
-
-        return f"""
+        yield """
         <div class="table-controls">
             <input type="text" id="actionFilter" placeholder="Filter actions..." onkeyup="filterTable()">
             <select id="actionTypeFilter" onchange="filterTable()">
@@ -188,12 +313,30 @@ class HTMLReporter(BaseReporter):
                     <th>Screenshot</th>
                 </tr>
             </thead>
-            <tbody>{"".join(rows)}</tbody>
+            <tbody>"""
+        render_row = _TABLE_ROW_TMPL.format_map
+        for round_index, _status, action, url, args, result, _preview, model_snippet, src in rows:
+            screenshot_cell = "—"
+            if src:
+                if self.embed_screenshots:
+                    screenshot_cell = f'<img src="{src}" class="thumb" />'
+                else:
+                    screenshot_cell = f'<a href="{src}" target="_blank">view</a>'
+
+            yield render_row({
+                "action": action,
+                "round": round_index,
+                "url": url,
+                "args": args,
+                "result": result,
+                "model": model_snippet,
+                "screenshot": screenshot_cell,
+            })
+        yield """</tbody>
         </table>"""
 
-    def _get_css(self) -> str:
-        """Return the CSS styles for the report."""
-        return """
+    # CSS styles for the report (minified once at import)
+    _CSS = _minify_css("""
         :root {
             --bg-primary: #0b1220;
             --bg-card: #111a2d;
@@ -689,11 +832,10 @@ class HTMLReporter(BaseReporter):
             .timeline { padding-left: 30px; }
             .timeline-marker { left: -26px; }
         }
-        """
+        """)
 
-    def _get_js(self) -> str:
-        """Return the JavaScript for interactivity."""
-        return """
+    # JavaScript for interactivity (minified once at import)
+    _JS = _minify_js("""
         function filterTable() {
             const filter = document.getElementById('actionFilter').value.toLowerCase();
             const typeFilter = document.getElementById('actionTypeFilter').value.toLowerCase();
@@ -726,6 +868,12 @@ class HTMLReporter(BaseReporter):
             document.getElementById(tabName).classList.add('active');
         }
         
+        // One delegated listener opens any screenshot, instead of one per <img>.
+        document.addEventListener('click', e => {
+            const img = e.target.closest('img.thumb, .screenshot-preview img');
+            if (img) openModal(img.src);
+        });
+        
         document.addEventListener('keydown', e => {
             if (e.key === 'Escape') closeModal();
         });
@@ -733,42 +881,87 @@ class HTMLReporter(BaseReporter):
         document.getElementById('imageModal')?.addEventListener('click', e => {
             if (e.target.id === 'imageModal') closeModal();
         });
-        """
+        """)
 
-    def generate(self, result: TestRunResult, output_dir: Path) -> Path:
-        """Generate HTML report for a single test result."""
+    # Static chrome encoded once at import; generate() writes these bytes as-is.
+    _CSS_BYTES = _CSS.encode("utf-8")
+    _JS_BYTES = _JS.encode("utf-8")
+    _INLINE_STYLE = b"<style>" + _CSS_BYTES + b"</style>"
+    _INLINE_SCRIPT = b"<script>" + _JS_BYTES + b"</script>"
+    _LINKED_STYLE = f'<link rel="stylesheet" href="{CSS_ASSET}">'.encode("utf-8")
+    _LINKED_SCRIPT = f'<script src="{JS_ASSET}"></script>'.encode("utf-8")
+    _BETWEEN_BYTES = b"""
+            </div>
+            <div id="tableView" class="tab-content">
+                """
+    _TAIL_BYTES = """
+            </div>
+        </div>
+    </div>
+
+    <div class="modal" id="imageModal" onclick="closeModal()">
+        <span class="modal-close" onclick="closeModal()">&times;</span>
+        <img id="modalImage" src="" alt="Screenshot">
+    </div>
+
+    """.encode("utf-8")
+    _END_BYTES = b"""
+</body>
+</html>"""
+
+    def generate(
+        self,
+        result: TestRunResult,
+        output_dir: Path,
+        *,
+        shared_assets: bool = False,
+        suite_name: Optional[str] = None,
+    ) -> Path:
+        """Generate HTML report for a single test result.
+
+        With ``shared_assets`` the page links ``report.css``/``report.js`` from
+        ``output_dir`` (written by ``generate_suite``) instead of inlining them.
+        ``suite_name`` is the suite page to link back to; when omitted, the
+        newest ``suite-*.html`` in ``output_dir`` is used.
+        """
         output_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-        filename = f"{result.case.id}-{timestamp}.html"
+        filename = f"{self._report_stem(result)}.html"
         target = output_dir / filename
 
         verdict_text = "PASS" if result.success else "FAIL"
         verdict_class = "pass" if result.success else "fail"
 
         # Check if there's a suite report to link back to
-        suite_reports = list(output_dir.glob("suite-*.html"))
+        if suite_name is None:
+            suite_name = _latest_suite_report(output_dir)
         back_button = ""
-        if suite_reports:
-            latest_suite = max(suite_reports, key=lambda p: p.stat().st_mtime)
-            back_button = f'<a href="{latest_suite.name}" class="back-button">← Back to Suite</a>'
+        if suite_name:
+            back_button = f'<a href="{suite_name}" class="back-button">← Back to Suite</a>'
 
-        html_content = f"""<!DOCTYPE html>
+        rows = self._pack_actions(result.actions, target.parent)
+        if shared_assets:
+            style_tag, script_tag = self._LINKED_STYLE, self._LINKED_SCRIPT
+        else:
+            style_tag, script_tag = self._INLINE_STYLE, self._INLINE_SCRIPT
+
+        title = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="utf-8">
     <meta name="viewport" content="width=device-width, initial-scale=1">
-    <title>E2E Report - {html.escape(result.case.id)}</title>
-    <style>{self._get_css()}</style>
+    <title>E2E Report - {_esc(result.case.id)}</title>
+    """
+        head = f"""
 </head>
-<body>
+<body>{"" if rows else _EMPTY_ICONS_SPRITE}
     <div class="container">
         {back_button}
         <div class="card">
             <div class="header">
                 <div class="header-content">
-                    <h1>{html.escape(result.case.objective)}</h1>
-                    <p>Task ID: <code>{html.escape(result.case.id)}</code></p>
-                    {f'<p>Start URL: <code>{html.escape(result.case.start_url)}</code></p>' if result.case.start_url else ''}
+                    <h1>{_esc(result.case.objective)}</h1>
+                    <p>Task ID: <code>{_esc(result.case.id)}</code></p>
+                    {f'<p>Start URL: <code>{_esc(result.case.start_url)}</code></p>' if result.case.start_url else ''}
                 </div>
                 <span class="badge {verdict_class}">{verdict_text}</span>
             </div>
@@ -776,7 +969,7 @@ class HTMLReporter(BaseReporter):
                 <div class="pill"><strong>Started:</strong> {result.started_at.strftime('%Y-%m-%d %H:%M:%S')} UTC</div>
                 <div class="pill"><strong>Finished:</strong> {result.finished_at.strftime('%Y-%m-%d %H:%M:%S')} UTC</div>
                 <div class="pill"><strong>Duration:</strong> {result.duration_seconds:.1f}s</div>
-                <div class="pill"><strong>Actions:</strong> {len(result.actions)}</div>
+                <div class="pill"><strong>Actions:</strong> {result.action_count}</div>
             </div>
             {self._render_result_message(result)}
         </div>
@@ -801,7 +994,7 @@ class HTMLReporter(BaseReporter):
 
         {f'''<div class="card">
             <h2>Notes</h2>
-            <p>{html.escape(result.case.notes)}</p>
+            <p>{_esc(result.case.notes)}</p>
         </div>''' if result.case.notes else ''}
 
         <div class="card">
@@ -811,28 +1004,25 @@ class HTMLReporter(BaseReporter):
                 <button class="tab" data-tab="tableView" onclick="switchTab('tableView')">Table</button>
             </div>
             <div id="timelineView" class="tab-content active">
-                {self._render_timeline(result.actions, target.parent)}
-            </div>
-            <div id="tableView" class="tab-content">
-                {self._render_actions_table(result.actions, target.parent)}
-            </div>
-        </div>
-    </div>
-
-    <div class="modal" id="imageModal" onclick="closeModal()">
-        <span class="modal-close" onclick="closeModal()">&times;</span>
-        <img id="modalImage" src="" alt="Screenshot">
-    </div>
-
-    <script>{self._get_js()}</script>
-</body>
-</html>"""
+                """
 
-        target.write_text(html_content, encoding="utf-8")
+        # Stream rows to disk rather than building the whole document as one
+        # string; chunks are encoded directly, bypassing the text-layer wrapper.
+        with open(target, "wb", buffering=1 << 20) as f:
+            f.write(title.encode("utf-8"))
+            f.write(style_tag)
+            f.write(head.encode("utf-8"))
+            f.writelines(chunk.encode("utf-8") for chunk in self._iter_timeline(rows))
+            f.write(self._BETWEEN_BYTES)
+            f.writelines(chunk.encode("utf-8") for chunk in self._iter_actions_table(rows))
+            f.write(self._TAIL_BYTES)
+            f.write(script_tag)
+            f.write(self._END_BYTES)
         return target
 
     def generate_suite(self, results: List[TestRunResult], output_dir: Path) -> Path:
         """Generate combined HTML report for multiple test results."""
+        _esc_cached.cache_clear()  # don't carry one suite's strings into the next
         output_dir.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
         filename = f"suite-{timestamp}.html"
@@ -842,41 +1032,44 @@ class HTMLReporter(BaseReporter):
         failed = len(results) - passed
         pass_rate = (passed / len(results) * 100) if results else 0
 
-        # Generate individual reports and collect their paths
-        individual_reports = {}
-        for result in results:
-            report_path = self.generate(result, output_dir)
-            individual_reports[result.case.id] = report_path.name
+        # Individual reports share one copy of the stylesheet and script.
+        (output_dir / CSS_ASSET).write_bytes(self._CSS_BYTES)
+        (output_dir / JS_ASSET).write_bytes(self._JS_BYTES)
+
+        # Generate individual reports and collect their paths. Each one is
+        # mostly screenshot reads, base64 and file writes, so they overlap well
+        # on threads; the reporter holds no per-report state. Duplicate case ids
+        # can map to the same file name, so those suites stay sequential.
+        def generate_one(result: TestRunResult) -> str:
+            return self.generate(result, output_dir, shared_assets=True, suite_name=filename).name
+
+        if len(results) > 1 and len({r.case.id for r in results}) == len(results):
+            with ThreadPoolExecutor(max_workers=min(_SUITE_WORKERS, len(results))) as pool:
+                names = list(pool.map(generate_one, results))
+        else:
+            names = [generate_one(r) for r in results]
+        individual_reports = {r.case.id: name for r, name in zip(results, names)}
 
         # Build test cards with links
+        render_card = _SUITE_CARD_TMPL.format_map
         test_cards = []
         for result in results:
-            verdict_class = "pass" if result.success else "fail"
-            verdict_text = "PASS" if result.success else "FAIL"
-            report_link = individual_reports.get(result.case.id, "#")
-            
             # Format reason with proper line breaks
-            reason_html = html.escape(result.reason)
+            reason_html = _esc(result.reason)
             if len(reason_html) > 200:
                 reason_html = reason_html[:200] + "..."
             reason_html = reason_html.replace('\n', '<br>')
-            
-            test_cards.append(f'''
-            <div class="test-card {verdict_class}">
-                <div class="test-header">
-                    <a href="{report_link}" class="test-name-link">
-                        <span class="test-name">{html.escape(result.case.id)}</span>
-                    </a>
-                    <span class="badge {verdict_class}">{verdict_text}</span>
-                </div>
-                <p class="test-objective">{html.escape(result.case.objective)}</p>
-                <div class="test-meta">
-                    <span>Duration: {result.duration_seconds:.1f}s</span>
-                    <span>Actions: {len(result.actions)}</span>
-                </div>
-                <p class="test-reason">{reason_html}</p>
-                <a href="{report_link}" class="view-details">View Details →</a>
-            </div>''')
+
+            test_cards.append(render_card({
+                "verdict_class": "pass" if result.success else "fail",
+                "verdict_text": "PASS" if result.success else "FAIL",
+                "link": individual_reports.get(result.case.id, "#"),
+                "case_id": _esc(result.case.id),
+                "objective": _esc(result.case.objective),
+                "duration": result.duration_seconds,
+                "actions": result.action_count,
+                "reason": reason_html,
+            }))
 
         html_content = f"""<!DOCTYPE html>
 <html lang="en">
@@ -885,7 +1078,7 @@ class HTMLReporter(BaseReporter):
     <meta name="viewport" content="width=device-width, initial-scale=1">
     <title>E2E Test Suite Report</title>
     <style>
-        {self._get_css()}
+        {self._CSS}
         .summary-grid {{
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
@@ -1015,7 +1208,7 @@ class HTMLReporter(BaseReporter):
 </body>
 </html>"""
 
-        target.write_text(html_content, encoding="utf-8")
+        target.write_bytes(html_content.encode("utf-8"))
         return target
 
 
@@ -9,6 +9,34 @@ from typing import Any, Dict, List
 from reporters.base import BaseReporter, ReportFormat
 from test_types import ActionTrace, TestRunResult
 
+try:  # optional fast path; stdlib json is used when orjson isn't installed
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+def _json_default(obj: Any) -> str:
+    """Serialize stray ``Path`` values (e.g. inside model arguments) as strings."""
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(target: Path, data: Dict[str, Any]) -> None:
+    """Encode ``data`` as indented UTF-8 JSON and write it in one call."""
+    if orjson is not None:
+        try:
+            target.write_bytes(orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS))
+            return
+        except TypeError:
+            pass  # e.g. big ints in model arguments; use stdlib
+    target.write_text(json.dumps(data, indent=2, default=_json_default), encoding="utf-8")
+
 
 class JSONReporter(BaseReporter):
     """Generate machine-readable JSON reports."""
@@ -43,12 +71,13 @@ class JSONReporter(BaseReporter):
                 "max_rounds": result.case.max_rounds,
             },
             "result": {
+                "run_id": result.run_id,
                 "success": result.success,
                 "reason": result.reason,
                 "started_at": result.started_at.isoformat(),
                 "finished_at": result.finished_at.isoformat(),
                 "duration_seconds": result.duration_seconds,
-                "total_actions": len(result.actions),
+                "total_actions": result.action_count,
                 "facts": result.facts,
             },
             "actions": [self._action_to_dict(a) for a in result.actions],
@@ -57,8 +86,7 @@ class JSONReporter(BaseReporter):
     def generate(self, result: TestRunResult, output_dir: Path) -> Path:
         """Generate JSON report for a single test result."""
         output_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-        filename = f"{result.case.id}-{timestamp}.json"
+        filename = f"{self._report_stem(result)}.json"
         target = output_dir / filename
 
         report_data = {
@@ -73,7 +101,7 @@ class JSONReporter(BaseReporter):
             },
         }
 
-        target.write_text(json.dumps(report_data, indent=2), encoding="utf-8")
+        _write_json(target, report_data)
         return target
 
     def generate_suite(self, results: List[TestRunResult], output_dir: Path) -> Path:
@@ -114,6 +142,6 @@ class JSONReporter(BaseReporter):
             ],
         }
 
-        target.write_text(json.dumps(report_data, indent=2), encoding="utf-8")
+        _write_json(target, report_data)
         return target
 
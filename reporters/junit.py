@@ -21,14 +21,17 @@ class JUnitReporter(BaseReporter):
         """Escape special XML characters."""
         return html.escape(str(text), quote=True)
 
+    def _escape_cdata(self, text: str) -> str:
+        """Split any ``]]>`` so free text can't terminate its CDATA section early."""
+        return str(text).replace("]]>", "]]]]><![CDATA[>")
+
     def _format_timestamp(self, dt: datetime) -> str:
         """Format datetime for JUnit XML."""
         return dt.strftime("%Y-%m-%dT%H:%M:%S")
 
-    def _build_testcase_xml(self, result: TestRunResult) -> str:
-        """Build XML for a single test case."""
-        lines = []
-        
+    def _build_testcase_xml(self, result: TestRunResult, lines: List[str]) -> None:
+        """Append XML lines for a single test case to the suite's ``lines``."""
+        cdata = self._escape_cdata
         classname = "fara.e2e"
         name = self._escape_xml(result.case.id)
         time_sec = f"{result.duration_seconds:.3f}"
@@ -40,12 +43,12 @@ class JUnitReporter(BaseReporter):
             # Add system-out with action summary
             if result.actions:
                 lines.append("      <system-out><![CDATA[")
-                lines.append(f"Objective: {result.case.objective}")
-                lines.append(f"URL: {result.case.start_url or 'N/A'}")
-                lines.append(f"Actions: {len(result.actions)}")
+                lines.append(f"Objective: {cdata(result.case.objective)}")
+                lines.append(f"URL: {cdata(result.case.start_url or 'N/A')}")
+                lines.append(f"Actions: {result.action_count}")
                 lines.append("")
-                for action in result.actions[-5:]:  # Last 5 actions
-                    lines.append(f"  [{action.round_index}] {action.action}: {action.result[:100]}")
+                for action in result.recent_actions(5):  # Last 5 actions
+                    lines.append(f"  [{action.round_index}] {cdata(action.action)}: {cdata(action.result[:100])}")
                 lines.append("]]></system-out>")
             lines.append("    </testcase>")
         else:
@@ -58,50 +61,50 @@ class JUnitReporter(BaseReporter):
             failure_type = "AssertionError" if "criteria" in result.reason.lower() else "TestFailure"
             
             lines.append(f'      <failure message="{failure_msg}" type="{failure_type}"><![CDATA[')
-            lines.append(f"Test Case: {result.case.id}")
-            lines.append(f"Objective: {result.case.objective}")
-            lines.append(f"Failure Reason: {result.reason}")
+            lines.append(f"Test Case: {cdata(result.case.id)}")
+            lines.append(f"Objective: {cdata(result.case.objective)}")
+            lines.append(f"Failure Reason: {cdata(result.reason)}")
             lines.append("")
             lines.append("Pass Criteria:")
             for criterion in result.case.pass_criteria:
-                lines.append(f"  - {criterion}")
+                lines.append(f"  - {cdata(criterion)}")
             lines.append("")
             lines.append("Fail Criteria:")
             for criterion in result.case.fail_criteria:
-                lines.append(f"  - {criterion}")
+                lines.append(f"  - {cdata(criterion)}")
             lines.append("")
-            lines.append(f"Total Actions: {len(result.actions)}")
+            lines.append(f"Total Actions: {result.action_count}")
             if result.actions:
                 lines.append("")
                 lines.append("Last Actions:")
-                for action in result.actions[-5:]:
-                    lines.append(f"  [{action.round_index}] {action.action} @ {action.page_url}")
-                    lines.append(f"      Result: {action.result[:150]}")
+                for action in result.recent_actions(5):
+                    lines.append(f"  [{action.round_index}] {cdata(action.action)} @ {cdata(action.page_url)}")
+                    lines.append(f"      Result: {cdata(action.result[:150])}")
             lines.append("]]></failure>")
             
             # Add system-err with model responses for failed tests
             lines.append("      <system-err><![CDATA[")
             lines.append("Model Responses (last 3):")
-            for action in result.actions[-3:]:
+            for action in result.recent_actions(3):
                 lines.append(f"\n--- Round {action.round_index} ---")
-                lines.append(action.model_response[:500])
+                lines.append(cdata(action.model_response[:500]))
             lines.append("]]></system-err>")
             
             lines.append("    </testcase>")
-        
-        return "\n".join(lines)
 
     def generate(self, result: TestRunResult, output_dir: Path) -> Path:
         """Generate JUnit XML report for a single test result."""
-        return self.generate_suite([result], output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return self._write([result], output_dir / f"junit-{self._report_stem(result)}.xml")
 
     def generate_suite(self, results: List[TestRunResult], output_dir: Path) -> Path:
         """Generate combined JUnit XML report for multiple test results."""
         output_dir.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-        filename = f"junit-{timestamp}.xml"
-        target = output_dir / filename
+        return self._write(results, output_dir / f"junit-{timestamp}.xml")
 
+    def _write(self, results: List[TestRunResult], target: Path) -> Path:
+        """Write the testsuite XML for ``results`` to ``target``."""
         # Calculate statistics
         tests = len(results)
         failures = sum(1 for r in results if not r.success)
@@ -134,10 +137,11 @@ class JUnitReporter(BaseReporter):
         
         # Add test cases
         for result in results:
-            lines.append(self._build_testcase_xml(result))
+            self._build_testcase_xml(result, lines)
         
         lines.append("</testsuite>")
 
-        target.write_text("\n".join(lines), encoding="utf-8")
+        # One join and one encode for the whole suite.
+        target.write_bytes("\n".join(lines).encode("utf-8"))
         return target
 
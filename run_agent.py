@@ -5,6 +5,7 @@ import json
 import logging
 
 from agent import FaraAgent
+from test_runner import install_fast_loop
 
 
 logging.basicConfig(
@@ -59,5 +60,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_fast_loop()
     asyncio.run(main())
 
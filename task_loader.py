@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set
 
@@ -10,6 +11,12 @@ import yaml
 from exceptions import TaskLoadError, TaskValidationError
 from test_types import TestCase
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Upper bound on threads used to read task files in discover_tasks.
+_LOAD_WORKERS = 16
+
 
 def _as_list(value: Any) -> List[str]:
     """Convert value to list of strings."""
@@ -121,7 +128,7 @@ def load_task_file(path: Path) -> TestCase:
     try:
         raw = path.read_text(encoding="utf-8")
         if path.suffix.lower() in {".yml", ".yaml"}:
-            data = yaml.safe_load(raw)
+            data = yaml.load(raw, Loader=_YAML_LOADER)
         else:
             data = json.loads(raw)
         return _parse_task(data, fallback_id=path.stem)
@@ -166,9 +173,15 @@ def discover_tasks(
     json_files = sorted(tasks_dir.glob("*.json"))
     all_files = yaml_files + json_files
     
-    for path in all_files:
-        task = load_task_file(path)
-        
+    # Read and parse files on a small pool so disk reads overlap; map() keeps
+    # file order and re-raises the first failing file's error, as a serial loop would.
+    if len(all_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(_LOAD_WORKERS, len(all_files))) as pool:
+            loaded = list(pool.map(load_task_file, all_files))
+    else:
+        loaded = [load_task_file(path) for path in all_files]
+
+    for task in loaded:
         # Filter by ID if specified
         if id_filter and task.id not in id_filter:
             continue
@@ -6,11 +6,13 @@ import asyncio
 import json
 import logging
 import sys
+import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Sequence, Set
 
 from agent import FaraAgent
+from browser import BrowserPool, SimpleBrowser
 from config import FaraConfig, load_config
 from exceptions import FaraError, TaskLoadError
 from reporters import HTMLReporter, JSONReporter, JUnitReporter, ReportFormat
@@ -26,18 +28,29 @@ class E2ETestRunner:
         self,
         config: FaraConfig,
         logger: Optional[logging.Logger] = None,
+        browser_pool: Optional[BrowserPool] = None,
     ):
         self.config = config
         self.logger = logger or logging.getLogger("e2e_runner")
+        # Long-lived callers (the MCP server) may lend a pool; otherwise run_all
+        # opens one for its duration so tasks share warm browser processes.
+        self._browser_pool: Optional[BrowserPool] = browser_pool
 
     async def run_task(
         self,
         case: TestCase,
         retry_attempt: int = 0,
         trace_path: Optional[Path] = None,
+        run_id: Optional[str] = None,
     ) -> TestRunResult:
-        """Run a single test case."""
-        run_id = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+        """Run a single test case.
+
+        ``run_id`` names the screenshot folder and report files; a unique one is
+        generated when omitted so concurrent runs of the same case never collide.
+        """
+        if not run_id:
+            stamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+            run_id = f"{case.id}-{stamp}-{uuid.uuid4().hex[:6]}"
         
         # Build agent config from FaraConfig
         agent_config = {
@@ -62,6 +75,7 @@ class E2ETestRunner:
             headless=self.config.browser.headless,
             browser_type=self.config.browser.browser,
             logger=self.logger,
+            browser_pool=self._browser_pool,
         )
         
         start = datetime.utcnow()
@@ -69,7 +83,7 @@ class E2ETestRunner:
             await agent.start()
             result = await agent.run_test_case(
                 test_case=case,
-                run_id=f"{case.id}-{run_id}",
+                run_id=run_id,
                 screenshots_root=self.config.reporting.screenshots_folder,
                 trace_path=trace_path,
             )
@@ -89,12 +103,18 @@ class E2ETestRunner:
                 facts=[],
                 retry_attempt=retry_attempt,
                 browser_type=self.config.browser.browser,
+                run_id=run_id,
             )
         finally:
             await agent.close()
 
-    async def run_task_with_retries(self, case: TestCase, trace_path: Optional[Path] = None) -> TestRunResult:
-        """Run a task with configured retries."""
+    async def run_task_with_retries(
+        self,
+        case: TestCase,
+        trace_path: Optional[Path] = None,
+        run_id: Optional[str] = None,
+    ) -> TestRunResult:
+        """Run a task with configured retries; retries of ``run_id`` get a ``-retryN`` suffix."""
         retry_count = case.retry_count
         last_result = None
         
@@ -102,7 +122,10 @@ class E2ETestRunner:
             if attempt > 0:
                 self.logger.info(f"Retrying task {case.id} (attempt {attempt + 1}/{retry_count + 1})")
             
-            result = await self.run_task(case, retry_attempt=attempt, trace_path=trace_path)
+            attempt_id = f"{run_id}-retry{attempt}" if run_id and attempt else run_id
+            result = await self.run_task(
+                case, retry_attempt=attempt, trace_path=trace_path, run_id=attempt_id
+            )
             last_result = result
             
             if result.success:
@@ -192,11 +215,20 @@ class E2ETestRunner:
         """Run all test cases with configured parallelism."""
         start_time = datetime.utcnow()
         
-        if self.config.parallel_workers > 1:
-            self.logger.info(f"Running {len(cases)} tests with {self.config.parallel_workers} parallel workers")
-            results = await self.run_parallel(cases, self.config.parallel_workers)
+        if self._browser_pool is not None:
+            results = await self._run_cases(cases)
         else:
-            results = await self.run_sequential(cases)
+            async with BrowserPool(
+                browser_type=self.config.browser.browser,
+                headless=self.config.browser.headless,
+                max_concurrency=self.config.parallel_workers,
+                logger=self.logger,
+            ) as pool:
+                self._browser_pool = pool
+                try:
+                    results = await self._run_cases(cases)
+                finally:
+                    self._browser_pool = None
         
         end_time = datetime.utcnow()
         
@@ -211,6 +243,12 @@ class E2ETestRunner:
         
         return suite_result
 
+    async def _run_cases(self, cases: Sequence[TestCase]) -> List[TestRunResult]:
+        if self.config.parallel_workers > 1:
+            self.logger.info(f"Running {len(cases)} tests with {self.config.parallel_workers} parallel workers")
+            return await self.run_parallel(cases, self.config.parallel_workers)
+        return await self.run_sequential(cases)
+
     def _generate_report(self, result: TestRunResult) -> None:
         """Generate reports for a single test result."""
         output_dir = self.config.reporting.reports_folder
@@ -439,6 +477,22 @@ Examples:
     return parser
 
 
+def install_fast_loop() -> bool:
+    """Use uvloop for the asyncio event loop when it is installed. Returns True if applied.
+
+    Call before asyncio.run(); Playwright IPC is many small awaits, which uvloop schedules
+    with less per-callback overhead than the default selector loop.
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 def main() -> None:
     """Main entry point."""
     parser = _build_arg_parser()
@@ -457,6 +511,8 @@ def main() -> None:
         format="[%(levelname)s] %(message)s" if not args.verbose else "[%(levelname)s] %(name)s: %(message)s",
     )
     logger = logging.getLogger("e2e_runner")
+
+    install_fast_loop()
     
     try:
         exit_code = asyncio.run(run_from_cli_args(args, logger))
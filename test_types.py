@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
@@ -88,9 +89,16 @@ class TestRunResult:
     # Additional metadata
     retry_attempt: int = 0
     browser_type: Optional[str] = None
+    run_id: Optional[str] = None
     final_url: Optional[str] = None
     console_errors: List[str] = field(default_factory=list)
 
+    def recent_actions(self, limit: int) -> List[ActionTrace]:
+        """Last ``limit`` actions, oldest first, without copying the rest."""
+        recent = list(islice(reversed(self.actions), limit))
+        recent.reverse()
+        return recent
+
     @property
     def duration_seconds(self) -> float:
         return max(0.0, (self.finished_at - self.started_at).total_seconds())
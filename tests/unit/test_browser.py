@@ -0,0 +1,99 @@
+"""Unit tests for browser module."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("playwright.async_api")
+
+from browser import BrowserPool, SimpleBrowser
+from exceptions import BrowserError
+
+
+def _launched_browser() -> MagicMock:
+    launched = MagicMock()
+    launched.is_connected.return_value = True
+    launched.new_context = AsyncMock(side_effect=RuntimeError("context failed"))
+    return launched
+
+
+class TestBrowserPool:
+    """Tests for BrowserPool slot accounting."""
+
+    async def test_failed_acquire_releases_slot_once(self):
+        pool = BrowserPool(browser_type="chromium", max_concurrency=1)
+        launched = _launched_browser()
+        pool._idle.append(launched)
+        browser = SimpleBrowser(browser_type="chromium")
+
+        with pytest.raises(RuntimeError):
+            await pool.acquire(browser)
+        # The agent still calls release() from close(); it must not free the slot again.
+        await pool.release(browser)
+
+        assert pool._idle == [launched]
+        assert browser.browser is None
+        assert pool._slots._value == 1
+
+    async def test_settings_mismatch_does_not_take_slot(self):
+        pool = BrowserPool(browser_type="chromium", max_concurrency=1)
+        browser = SimpleBrowser(browser_type="firefox")
+
+        with pytest.raises(BrowserError):
+            await pool.acquire(browser)
+        await pool.release(browser)
+
+        assert pool._slots._value == 1
+
+
+def _keyboard_browser(browser_type: str) -> tuple[SimpleBrowser, list, MagicMock]:
+    """SimpleBrowser on a mocked page that logs keyboard calls and CDP key events in order."""
+    calls: list = []
+    browser = SimpleBrowser(browser_type=browser_type)
+    browser.page = MagicMock()
+    browser.page.keyboard.type = AsyncMock(side_effect=lambda text: calls.append(("type", text)))
+    browser.page.keyboard.press = AsyncMock(side_effect=lambda key: calls.append(("press", key)))
+    cdp = MagicMock()
+    cdp.send = AsyncMock(
+        side_effect=lambda method, event: calls.append((event["type"], event["key"]))
+    )
+    browser.context = MagicMock()
+    browser.context.new_cdp_session = AsyncMock(return_value=cdp)
+    return browser, calls, browser.context.new_cdp_session
+
+
+class TestPressKeys:
+    """Tests for SimpleBrowser.press_keys batching."""
+
+    async def test_chromium_keeps_mixed_key_order(self):
+        browser, calls, new_cdp_session = _keyboard_browser("chromium")
+
+        await browser.press_keys(["a", "b", "Tab", "Enter", "Control+A", "c", "ArrowDown"])
+
+        assert calls == [
+            ("type", "ab"),
+            ("rawKeyDown", "Tab"),
+            ("keyUp", "Tab"),
+            ("keyDown", "Enter"),
+            ("keyUp", "Enter"),
+            ("press", "Control+A"),
+            ("type", "c"),
+            ("rawKeyDown", "ArrowDown"),
+            ("keyUp", "ArrowDown"),
+        ]
+        new_cdp_session.assert_awaited_once()
+
+    async def test_other_engines_fall_back_to_keyboard_press(self):
+        browser, calls, new_cdp_session = _keyboard_browser("firefox")
+
+        await browser.press_keys(["a", "b", "Tab", "Enter", "Control+A", "c"])
+
+        assert calls == [
+            ("type", "ab"),
+            ("press", "Tab"),
+            ("press", "Enter"),
+            ("press", "Control+A"),
+            ("type", "c"),
+        ]
+        new_cdp_session.assert_not_awaited()
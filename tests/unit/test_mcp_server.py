@@ -0,0 +1,74 @@
+"""Unit tests for the MCP server run index."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from mcp_server import RunIndex, RunRecord
+
+
+def _record(run_id: str, status: str = "queued") -> RunRecord:
+    return RunRecord(
+        run_id=run_id,
+        task_id="task",
+        status=status,
+        success=None,
+        reason=None,
+        started_at="2024-01-01T10:00:00",
+        finished_at=None,
+        report_paths=None,
+    )
+
+
+class TestRunIndex:
+    """Tests for the snapshot + journal persistence of RunIndex."""
+
+    def test_journal_replays_after_restart(self, temp_dir: Path):
+        path = temp_dir / "run_index.json"
+        index = RunIndex(path)
+        record = _record("run-1")
+        index.put(record)
+        record.status = "passed"
+        record.success = True
+        index.put(record)
+
+        assert not path.exists()
+        assert len(index._journal_path.read_bytes().splitlines()) == 2
+
+        reloaded = RunIndex(path)
+        assert reloaded.get("run-1").status == "passed"
+        assert reloaded.get("run-1").success is True
+        assert len(reloaded.list_runs()) == 1
+
+    def test_compacts_journal_at_threshold(self, temp_dir: Path):
+        path = temp_dir / "run_index.json"
+        index = RunIndex(path)
+        index.COMPACT_LINES = 3
+        for i in range(2):
+            index.put(_record(f"run-{i}"))
+        assert not path.exists()
+
+        index.put(_record("run-2"))
+
+        assert not index._journal_path.exists()
+        assert set(json.loads(path.read_bytes())) == {"run-0", "run-1", "run-2"}
+        assert len(RunIndex(path).list_runs()) == 3
+
+    def test_ignores_truncated_last_journal_line(self, temp_dir: Path):
+        path = temp_dir / "run_index.json"
+        index = RunIndex(path)
+        index.put(_record("run-1", status="passed"))
+        with open(index._journal_path, "ab") as f:
+            f.write(b'{"run_id": "run-2", "task_id": "ta')
+
+        reloaded = RunIndex(path)
+        assert reloaded.get("run-1").status == "passed"
+        assert reloaded.get("run-2") is None
+
+        # New writes still land and replay past the torn line.
+        reloaded.put(_record("run-3"))
+        assert RunIndex(path).get("run-3") is not None
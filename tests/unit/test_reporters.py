@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime
 from pathlib import Path
 from xml.etree import ElementTree
 
 import pytest
 
 from reporters import HTMLReporter, JSONReporter, JUnitReporter
-from test_types import TestRunResult
+from test_types import ActionTrace, TestCase, TestRunResult
 
 
 class TestJSONReporter:
@@ -124,6 +125,41 @@ class TestJUnitReporter:
         assert root.get("tests") == "2"
         assert root.get("failures") == "1"
 
+    def test_cdata_terminator_round_trips(self, temp_dir: Path):
+        result = TestRunResult(
+            case=TestCase(
+                id="cdata",
+                objective="Objective with ]]> inside",
+                objective_steps=[],
+                pass_criteria=["Pass"],
+                fail_criteria=["Fail"],
+            ),
+            success=False,
+            started_at=datetime(2024, 1, 1, 10, 0, 0),
+            finished_at=datetime(2024, 1, 1, 10, 0, 5),
+            reason="Failed with ]]> in reason",
+            actions=[
+                ActionTrace(
+                    round_index=1,
+                    action="click",
+                    arguments={},
+                    model_response="weird ]]> output",
+                    result="ok ]]>",
+                    page_url="https://example.com",
+                ),
+            ],
+        )
+
+        reporter = JUnitReporter()
+        report_path = reporter.generate(result, temp_dir)
+
+        root = ElementTree.parse(report_path).getroot()
+        assert "weird ]]> output" in root.find(".//system-err").text
+        failure_text = root.find(".//failure").text
+        assert "Objective: Objective with ]]> inside" in failure_text
+        assert "Failure Reason: Failed with ]]> in reason" in failure_text
+        assert "Result: ok ]]>" in failure_text
+
 
 class TestHTMLReporter:
     """Tests for HTML reporter."""
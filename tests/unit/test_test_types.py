@@ -193,6 +193,36 @@ class TestTestRunResult:
         result.success = False
         assert result.status == "failed"
 
+    def test_recent_actions(self):
+        actions = [
+            ActionTrace(
+                round_index=i,
+                action="click",
+                arguments={},
+                model_response="",
+                result="",
+                page_url="",
+            )
+            for i in range(300)
+        ]
+        result = TestRunResult(
+            case=TestCase(
+                id="test",
+                objective="Test",
+                objective_steps=[],
+                pass_criteria=["Pass"],
+                fail_criteria=["Fail"],
+            ),
+            success=True,
+            started_at=datetime.now(),
+            finished_at=datetime.now(),
+            reason="Done",
+            actions=actions,
+        )
+        assert result.action_count == 300
+        assert [a.round_index for a in result.actions[:2]] == [0, 1]
+        assert [a.round_index for a in result.recent_actions(3)] == [297, 298, 299]
+
 
 class TestTestSuiteResult:
     """Tests for TestSuiteResult dataclass."""